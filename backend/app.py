@@ -1,34 +1,96 @@
 """Resume Job Matcher - Main Flask Application"""
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_file, Response, stream_with_context, g
 from flask_cors import CORS
 import os
 from werkzeug.utils import secure_filename
 import time
 from datetime import datetime
 import glob
+import json
+import cProfile
+import tempfile
+import unicodedata
+from urllib.parse import quote as url_quote
+from concurrent.futures import ThreadPoolExecutor
 
 # Import custom modules
-from resume_parser import extract_resume, extract_email, extract_phone, extract_skills
-from job_scraper import scrape_jobs_multi, get_fallback_jobs
-from job_matcher import recommend_jobs
-from vba_export import create_vba_excel_report
+import metrics
+from resume_parser import PARSER_VERSION
+from job_scraper import scrape_jobs_multi, get_fallback_jobs, extract_skills_from_title
+from job_matcher import JobIndex, MatchCache
+from batch_matcher import BatchMatcher
+from bulk_pipeline import batched, iter_parsed, parse_resume, summarize_result
+from parse_cache import ParseCache
+from bulk_jobs import BulkJobManager
+from job_cache import JobCache
+from job_store import JobStore
+from candidate_pool import CandidatePool, job_key
+from match_export import MatchExportWriter
+from report_cache import ReportCache, payload_digest
+from vba_export import create_vba_excel_report, write_vba_report, iter_jobs_csv, report_filename, BulkReportWriter
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=['Content-Disposition', 'ETag'])
 
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'docx', 'pdf', 'doc'}
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+app.config['BULK_WORKERS'] = int(os.environ.get('BULK_WORKERS', os.cpu_count() or 1))
+app.config['BULK_FILE_TIMEOUT'] = int(os.environ.get('BULK_FILE_TIMEOUT', 60))
+app.config['BULK_MATCH_BATCH'] = int(os.environ.get('BULK_MATCH_BATCH', 32))  # resumes scored per matrix pass
+app.config['BULK_MATCH_WINDOW'] = float(os.environ.get('BULK_MATCH_WINDOW', 0.5))  # max seconds a parsed resume waits for its batch
+app.config['SCRAPE_DEADLINE'] = float(os.environ.get('SCRAPE_DEADLINE', 15))
+app.config['JOB_STORE'] = os.environ.get('JOB_STORE', 'jobs.db')  # empty = in-memory only
+app.config['JOB_EXPIRE'] = int(os.environ.get('JOB_EXPIRE', 86400))  # drop postings unseen this long
+app.config['CANDIDATE_POOL'] = os.environ.get('CANDIDATE_POOL', 'candidates.db')  # empty = don't keep parsed resumes
+app.config['CANDIDATE_TOP_N'] = int(os.environ.get('CANDIDATE_TOP_N', 20))
+app.config['MATCH_CANDIDATES_MAX'] = int(os.environ.get('MATCH_CANDIDATES_MAX', 200))  # cap on top_k for /api/match-candidates
+app.config['PARSE_CACHE_DIR'] = os.environ.get('PARSE_CACHE_DIR', 'parse_cache')  # empty = off
+app.config['PARSE_CACHE_MAX_MB'] = int(os.environ.get('PARSE_CACHE_MAX_MB', 256))
+app.config['PERSIST_UPLOADS'] = os.environ.get('PERSIST_UPLOADS', '1') != '0'  # keep copies for bulk runs
+app.config['CACHE_PREWARM'] = int(os.environ.get('CACHE_PREWARM', 0))  # seconds before expiry, 0 = off
+app.config['MATCH_CACHE_SIZE'] = int(os.environ.get('MATCH_CACHE_SIZE', 256))  # scored resumes kept for filtering
+app.config['MATCH_CACHE_TTL'] = int(os.environ.get('MATCH_CACHE_TTL', 600))
+app.config['BULK_EXPORTS'] = [f for f in os.environ.get('BULK_EXPORTS', 'csv.gz,parquet').split(',') if f]  # parquet needs pyarrow
+app.config['REPORT_CACHE_MB'] = int(os.environ.get('REPORT_CACHE_MB', 64))  # generated exports kept for repeat downloads
+app.config['PROFILE_DIR'] = os.environ.get('PROFILE_DIR', '')  # empty = ?profile=1 disabled
 
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
-# Global job cache
-jobCache = []
-cacheTime = 0
-cacheDur = 1800  # 30 minutes
+parseCache = ParseCache(
+    app.config['PARSE_CACHE_DIR'],
+    PARSER_VERSION,
+    max_bytes=app.config['PARSE_CACHE_MAX_MB'] * 1024 * 1024
+) if app.config['PARSE_CACHE_DIR'] else None
+
+uploadWriter = ThreadPoolExecutor(max_workers=1, thread_name_prefix='upload-writer')
+reportCache = ReportCache(max_bytes=app.config['REPORT_CACHE_MB'] * 1024 * 1024)
+
+REPORT_TYPES = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv'
+}
+REPORT_CHUNK = 64 * 1024
+
+
+def save_upload(fpath, data):
+    """Write an uploaded resume to disk (runs on the upload writer thread)"""
+    # Written under a temporary name so a directory listing never sees a partial file
+    tmp = fpath + '.part'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, fpath)
+    except OSError as e:
+        print(f"Could not save upload {fpath}: {e}")
+
+
+def flush_uploads():
+    """Wait until every upload queued so far has been written to disk"""
+    uploadWriter.submit(lambda: None).result()
 
 
 def allowed_file(fname):
@@ -36,39 +98,137 @@ def allowed_file(fname):
     return '.' in fname and fname.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
-def get_jobs_db(force_refresh=False):
-    """Get jobs from cache or scrape fresh"""
-    global jobCache, cacheTime
+def mark_jobs(jobs, is_fallback):
+    """
+    Stamp jobs with the scrape time and whether they came from the fallback list
+
+    Jobs that already carry an is_fallback flag (fallback postings padded
+    in by merge_sources) keep it.
+    """
+    scrape_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for job in jobs:
+        job['scraped_at'] = scrape_time
+        if 'is_fallback' not in job:
+            job['is_fallback'] = is_fallback
+    return jobs
+
+
+def load_jobs(on_late):
+    """Scrape fresh jobs for the job cache, falling back to the built-in list"""
+    print("Scraping fresh jobs...")
+    jobs = scrape_jobs_multi(kw="software developer", loc="", max_jobs=25,
+                             deadline=app.config['SCRAPE_DEADLINE'],
+                             on_late=lambda late: on_late(mark_jobs(late, False)))
     
-    cur_time = time.time()
-    cache_age = cur_time - cacheTime if cacheTime > 0 else 0
+    if not jobs or len(jobs) == 0:
+        print("Scraping failed, using fallback")
+        return mark_jobs([dict(job, source='fallback') for job in get_fallback_jobs()], True)
     
-    if not force_refresh and jobCache and cache_age < cacheDur:
-        cache_min = int(cache_age / 60)
-        print(f"Using cached jobs (cached {cache_min} min ago)")
-        return jobCache
+    print(f"Got {len(jobs)} fresh jobs")
+    return mark_jobs(jobs, False)
+
+
+# Global job cache
+cacheDur = 1800  # 30 minutes
+jobStore = JobStore(app.config['JOB_STORE'], expire_after=app.config['JOB_EXPIRE']) if app.config['JOB_STORE'] else None
+jobCache = JobCache(load_jobs, ttl=cacheDur, store=jobStore)
+jobIndex = None
+batchMatcher = None
+matchCache = MatchCache(maxsize=app.config['MATCH_CACHE_SIZE'], ttl=app.config['MATCH_CACHE_TTL'])
+
+bulkJobs = BulkJobManager(max_workers=int(os.environ.get('BULK_JOBS', 2)))
+
+# Parsed resumes whose top matches are kept current as the job feed changes
+candidatePool = CandidatePool(
+    app.config['CANDIDATE_POOL'],
+    top_n=app.config['CANDIDATE_TOP_N']
+) if app.config['CANDIDATE_POOL'] else None
+rerankWorker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='candidate-rerank')
+
+
+def rerank_candidates(jobs):
+    """Apply a new job snapshot to the stored candidates' rankings (delta only)"""
+    index = jobIndex if jobIndex is not None and jobIndex.jobs is jobs else None
+    try:
+        with metrics.timer('candidate_rerank_seconds'):
+            stats = candidatePool.apply_feed(jobs, index=index)
+    except Exception as e:
+        print(f"Candidate re-ranking failed: {e}")
+        return
+    if stats['added'] or stats['changed'] or stats['removed']:
+        print(f"Re-ranked candidates: {stats}")
+
+
+def add_candidate(parsed, index):
+    """Store a parsed resume in the candidate pool (runs on the rerank worker)"""
+    try:
+        candidatePool.add(parsed, index)
+    except Exception as e:
+        print(f"Could not store candidate {parsed.get('filename')}: {e}")
+
+
+if candidatePool:
+    jobCache.add_listener(lambda jobs: rerankWorker.submit(rerank_candidates, jobs))
+
+# Bulk parse workers re-import this module as __mp_main__; only the
+# server process should prewarm
+if app.config['CACHE_PREWARM'] > 0 and __name__ != '__mp_main__':
+    jobCache.start_scheduler(lead=app.config['CACHE_PREWARM'])
+
+
+def get_jobs_db(force_refresh=False):
+    """Get jobs from cache; stale jobs are served while a background refresh runs"""
+    return jobCache.get(force_refresh)
+
+
+def get_job_index(force_refresh=False):
+    """Get the skill index over the cached jobs, rebuilt when the cache changes"""
+    global jobIndex
     
-    print("Scraping fresh jobs...")
-    jobs = scrape_jobs_multi(kw="software developer", loc="", max_jobs=25)
+    jobs = get_jobs_db(force_refresh)
+    if jobIndex is None or jobIndex.jobs is not jobs:
+        jobIndex = JobIndex(jobs)
+        matchCache.clear()
     
-    scrape_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return jobIndex
+
+
+def get_batch_matcher():
+    """Get the vectorized matcher over the cached jobs, rebuilt when the cache changes"""
+    global batchMatcher
     
-    if not jobs or len(jobs) == 0:
-        print("Scraping failed, using fallback")
-        jobs = get_fallback_jobs()
-        for job in jobs:
-            job['scraped_at'] = scrape_time
-            job['is_fallback'] = True
-    else:
-        print(f"Got {len(jobs)} fresh jobs")
-        for job in jobs:
-            job['scraped_at'] = scrape_time
-            job['is_fallback'] = False
+    jobs = get_jobs_db()
+    if batchMatcher is None or batchMatcher.jobs is not jobs:
+        batchMatcher = BatchMatcher(jobs)
     
-    jobCache = jobs
-    cacheTime = cur_time
+    return batchMatcher
+
+
+@app.before_request
+def start_request_timer():
+    """Start the latency timer and, when asked for, a per-request profiler"""
+    g.started = time.perf_counter()
+    if app.config['PROFILE_DIR'] and request.args.get('profile') == '1':
+        g.profiler = cProfile.Profile()
+        g.profiler.enable()
+
+
+@app.after_request
+def record_request(resp):
+    """Record request latency and dump the request's profile if one was taken"""
+    profiler = g.pop('profiler', None)
+    if profiler:
+        profiler.disable()
+        os.makedirs(app.config['PROFILE_DIR'], exist_ok=True)
+        pname = f"{request.endpoint or 'unknown'}-{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.prof"
+        profiler.dump_stats(os.path.join(app.config['PROFILE_DIR'], pname))
+        resp.headers['X-Profile-File'] = pname
     
-    return jobs
+    if 'started' in g:
+        metrics.observe('http_request_seconds', time.perf_counter() - g.started,
+                        endpoint=request.url_rule.rule if request.url_rule else 'unmatched',
+                        method=request.method, status=resp.status_code)
+    return resp
 
 
 # ============ API ENDPOINTS ============
@@ -86,42 +246,51 @@ def upload_resume():
     
     if file and allowed_file(file.filename):
         fname = secure_filename(file.filename)
-        fpath = os.path.join(app.config['UPLOAD_FOLDER'], fname)
-        file.save(fpath)
         
-        txt = extract_resume(fpath)
-        email = extract_email(txt)
-        phone = extract_phone(txt)
-        resume_skills = extract_skills(txt)
+        # Parse straight from the request body; saving to uploads/ happens off the request path
+        data = file.stream.read()
+        if app.config['PERSIST_UPLOADS']:
+            uploadWriter.submit(save_upload, os.path.join(app.config['UPLOAD_FOLDER'], fname), data)
+        
+        parsed = parse_resume(memoryview(data), fname, parseCache)
+        email = parsed['email']
+        phone = parsed['phone']
+        resume_skills = parsed['skills']
         
         print(f"Extracted {len(resume_skills)} skills")
         print(f"Skills: {resume_skills}")
         
-        all_jobs = recommend_jobs(resume_skills, get_jobs_db(), top_n=50, min_match=0)
+        # One scoring pass; recommendations, the fallback and later filter requests are views of it
+        index = get_job_index()
+        match = matchCache.rank(index, resume_skills, jobCache.generation)
+        if candidatePool:
+            rerankWorker.submit(add_candidate, parsed, index)
         
-        locs = list(set([job['location'] for job in all_jobs if job['location'] != 'Not specified']))
-        all_skills_set = set()
-        for job in all_jobs:
-            all_skills_set.update(job.get('required_skills', []))
-        avail_skills = sorted(list(all_skills_set))
+        # Filter options come from the facets computed when the cache was refreshed
+        facets = jobCache.facets
+        locs = [f['value'] for f in facets['locations']]
+        avail_skills = [f['value'] for f in facets['skills']]
         
-        jobs = recommend_jobs(resume_skills, get_jobs_db(), top_n=20, min_match=10)
+        jobs = match.top(top_n=20, min_match=10)
         
         print(f"Got {len(jobs)} recommendations")
         
         if not jobs:
             print("No jobs with >10% match, lowering threshold")
-            jobs = recommend_jobs(resume_skills, get_jobs_db(), top_n=20, min_match=0)
+            jobs = match.top(top_n=20, min_match=0)
         
-        cache_age = time.time() - cacheTime if cacheTime > 0 else 0
+        cache_age = jobCache.age()
         cache_min = int(cache_age / 60)
-        last_upd = datetime.fromtimestamp(cacheTime).strftime("%Y-%m-%d %H:%M:%S") if cacheTime > 0 else "Just now"
+        last_upd = datetime.fromtimestamp(jobCache.updated_at).strftime("%Y-%m-%d %H:%M:%S") if jobCache.updated_at > 0 else "Just now"
         
         return jsonify({
             'success': True,
             'filename': fname,
             'email': email,
             'phone': phone,
+            'name': parsed['name'],
+            'linkedin': parsed['linkedin'],
+            'github': parsed['github'],
             'skills': resume_skills,
             'jobs': jobs,
             'total_jobs': len(jobs),
@@ -145,27 +314,45 @@ def scrape_jobs():
     loc = data.get('location', '')
     max_jobs = data.get('max_jobs', 20)
     
-    jobs = scrape_jobs_multi(kw=kw, loc=loc, max_jobs=max_jobs)
+    jobs = scrape_jobs_multi(kw=kw, loc=loc, max_jobs=max_jobs, deadline=app.config['SCRAPE_DEADLINE'])
     
-    if not jobs:
-        jobs = get_fallback_jobs()
+    is_fallback = not jobs
+    if is_fallback:
+        jobs = [dict(job, source='fallback') for job in get_fallback_jobs()]
     
-    global jobCache, cacheTime
-    jobCache = jobs
-    cacheTime = time.time()
+    jobCache.set(mark_jobs(jobs, is_fallback))
     
     return jsonify({
         'success': True,
         'jobs_count': len(jobs),
         'jobs': jobs,
-        'source': 'scraped' if jobs != get_fallback_jobs() else 'fallback'
+        'source': 'fallback' if is_fallback else 'scraped'
     })
 
 
+def filter_listing(jobs, loc=None, skill=None):
+    """Jobs whose location contains loc and that require skill (same rules as JobStore.query)"""
+    if loc:
+        jobs = [job for job in jobs if loc.lower() in job.get('location', '').lower()]
+    if skill:
+        jobs = [job for job in jobs if skill.lower().strip() in [s.lower().strip() for s in job['required_skills']]]
+    return jobs
+
+
 @app.route('/api/jobs', methods=['GET'])
 def get_jobs():
-    """Get cached jobs"""
+    """Get cached jobs (?location= and ?skill= filter scraped jobs through the job store)"""
+    loc = request.args.get('location')
+    skill = request.args.get('skill')
+    
     jobs = get_jobs_db()
+    if jobStore and (loc or skill):
+        # The store only holds scraped postings; fallback padding is filtered here
+        fallback = [job for job in jobs if job.get('is_fallback')]
+        jobs = jobStore.query(location=loc, skill=skill) + filter_listing(fallback, loc, skill)
+    else:
+        jobs = filter_listing(jobs, loc, skill)
+    
     return jsonify({
         'success': True,
         'jobs_count': len(jobs),
@@ -185,9 +372,9 @@ def filter_jobs():
     
     print(f"Filtering: loc={loc_filter}, skills={skill_filters}, minMatch={min_match}")
     
-    jobs = recommend_jobs(
-        resume_skills, 
-        get_jobs_db(),
+    # Scores are cached per resume, so changing filters only re-runs the post-filters
+    match = matchCache.rank(get_job_index(), resume_skills, jobCache.generation)
+    jobs = match.top(
         top_n=50, 
         min_match=min_match,
         loc_filter=loc_filter,
@@ -204,22 +391,35 @@ def filter_jobs():
 @app.route('/api/cache-status', methods=['GET'])
 def cache_status():
     """Check cache status"""
-    cur_time = time.time()
-    cache_age = cur_time - cacheTime if cacheTime > 0 else 0
+    cache_age = jobCache.age()
     cache_min = int(cache_age / 60)
     
-    is_fresh = cache_age < cacheDur
-    last_upd = datetime.fromtimestamp(cacheTime).strftime("%Y-%m-%d %H:%M:%S") if cacheTime > 0 else "Never"
+    is_fresh = jobCache.is_fresh()
+    last_upd = datetime.fromtimestamp(jobCache.updated_at).strftime("%Y-%m-%d %H:%M:%S") if jobCache.updated_at > 0 else "Never"
     
     return jsonify({
         'cache_age_minutes': cache_min,
+        'cache_age_seconds': round(cache_age, 1),
         'is_fresh': is_fresh,
         'last_updated': last_upd,
-        'jobs_count': len(jobCache),
-        'cache_duration_minutes': int(cacheDur / 60)
+        'jobs_count': len(jobCache.jobs),
+        'cache_duration_minutes': int(cacheDur / 60),
+        **jobCache.status()
     })
 
 
+@app.route('/api/facets', methods=['GET'])
+def get_facets():
+    """Location, skill and source counts over the cached jobs (supports If-None-Match)"""
+    get_jobs_db()
+    facets = jobCache.facets
+    
+    resp = jsonify({'success': True, **facets})
+    resp.set_etag(facets['etag'])
+    resp.cache_control.no_cache = True
+    return resp.make_conditional(request)
+
+
 @app.route('/api/refresh-jobs', methods=['POST'])
 def refresh_jobs():
     """Force refresh jobs from live sources"""
@@ -245,7 +445,8 @@ def export_excel():
     skills = data.get('skills', [])
     jobs = data.get('jobs', [])
     
-    result = create_vba_excel_report(fname, email, phone, skills, jobs, app.config['UPLOAD_FOLDER'])
+    with metrics.timer('excel_report_seconds', kind='single'):
+        result = create_vba_excel_report(fname, email, phone, skills, jobs, app.config['UPLOAD_FOLDER'])
     
     return jsonify({
         'success': result['success'],
@@ -257,11 +458,144 @@ def export_excel():
     })
 
 
+@app.route('/api/export-report', methods=['POST'])
+def export_report():
+    """Stream a job match report (?format=xlsx|csv) in the response without saving it"""
+    data = request.get_json() or {}
+    fmt = request.args.get('format', 'xlsx').lower()
+    if fmt not in REPORT_TYPES:
+        return jsonify({'error': f'Unsupported format: {fmt}'}), 400
+    
+    payload = {
+        'filename': data.get('filename', 'resume'),
+        'email': data.get('email', 'N/A'),
+        'phone': data.get('phone', 'N/A'),
+        'skills': data.get('skills', []),
+        'jobs': data.get('jobs', [])
+    }
+    
+    # Identical payloads map to the same report, which doubles as its ETag
+    etag = payload_digest(payload, fmt)
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+        resp.set_etag(etag)
+        return resp
+    
+    cached = reportCache.get(etag)
+    metrics.inc('report_cache_requests_total', result='hit' if cached else 'miss')
+    if cached:
+        body, dname = cached
+        chunks = (body[i:i + REPORT_CHUNK] for i in range(0, len(body), REPORT_CHUNK))
+    else:
+        dname = report_filename(payload['filename'], fmt)
+        chunks = generate_report(payload, fmt, etag, dname)
+    
+    resp = Response(stream_with_context(chunks), mimetype=REPORT_TYPES[fmt])
+    resp.headers.set('Content-Disposition', 'attachment', **attachment_names(dname))
+    resp.set_etag(etag)
+    resp.cache_control.private = True
+    resp.cache_control.no_cache = True
+    return resp
+
+
+def attachment_names(dname):
+    """Content-Disposition filename parameters, with an RFC 5987 form for non-ASCII names"""
+    try:
+        dname.encode('ascii')
+        return {'filename': dname}
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize('NFKD', dname).encode('ascii', 'ignore').decode('ascii')
+        return {'filename': simple, 'filename*': f"UTF-8''{url_quote(dname, safe='')}"}
+
+
+def generate_report(payload, fmt, etag, dname):
+    """Yield a freshly generated report in chunks, caching the bytes once complete"""
+    parts = []
+    size = 0
+    
+    def keep(chunk):
+        # Reports too big for the cache are streamed without being held in memory
+        nonlocal parts, size
+        size += len(chunk)
+        if parts is not None and size > reportCache.max_item_bytes:
+            parts = None
+        elif parts is not None:
+            parts.append(chunk)
+        return chunk
+    
+    if fmt == 'csv':
+        for text in iter_jobs_csv(payload['jobs']):
+            yield keep(text.encode('utf-8'))
+    else:
+        # Spooled: stays in memory for normal reports, spills to a temp file for huge ones
+        with tempfile.SpooledTemporaryFile(max_size=reportCache.max_item_bytes) as spool:
+            with metrics.timer('excel_report_seconds', kind='single'):
+                write_vba_report(spool, **payload)
+            spool.seek(0)
+            for chunk in iter(lambda: spool.read(REPORT_CHUNK), b''):
+                yield keep(chunk)
+    
+    if parts is not None:
+        reportCache.put(etag, b''.join(parts), dname)
+
+
+def run_bulk_job(job):
+    """Parse, match and report every file of a bulk job, publishing results as they finish"""
+    matcher = get_batch_matcher()
+    stamp = f"{job.id[:8]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    report = BulkReportWriter(app.config['UPLOAD_FOLDER'], fname=f"bulk_processing_{stamp}.xlsx")
+    matches = MatchExportWriter(app.config['UPLOAD_FOLDER'], f"bulk_matches_{stamp}",
+                                formats=app.config['BULK_EXPORTS']) if app.config['BULK_EXPORTS'] else None
+    
+    parsed_iter = iter_parsed(
+        job.fpaths,
+        workers=app.config['BULK_WORKERS'],
+        timeout=app.config['BULK_FILE_TIMEOUT'],
+        cache=parseCache
+    )
+    try:
+        # Parsed resumes are scored a chunk at a time in one matrix pass;
+        # a chunk closes when full or BULK_MATCH_WINDOW seconds after it opened
+        for pairs in batched(parsed_iter, size=app.config['BULK_MATCH_BATCH'], window=app.config['BULK_MATCH_WINDOW']):
+            chunk = [parsed for _, parsed in pairs]
+            ok = [p for p in chunk if 'error' not in p]
+            tops = iter(matcher.recommend_many([p['skills'] for p in ok], top_n=10, min_match=10)) if ok else None
+            for parsed in chunk:
+                metrics.inc('bulk_files_total', result='error' if 'error' in parsed else 'ok')
+                if 'error' in parsed:
+                    jobs = []
+                    result = parsed
+                else:
+                    jobs = next(tops)
+                    result = summarize_result(parsed, jobs)
+                    if candidatePool:
+                        rerankWorker.submit(add_candidate, parsed, get_job_index())
+                # Excel and match export rows are streamed out as results arrive instead of built at the end
+                report.add(result)
+                if matches:
+                    matches.add(parsed, jobs)
+                job.add_result(result)
+        
+        with metrics.timer('excel_report_seconds', kind='bulk'):
+            excel_report = report.close()
+        exports = matches.close() if matches else {}
+    except Exception:
+        report.discard()
+        if matches:
+            matches.discard()
+        raise
+    
+    job.finish(excel_report=excel_report, exports=exports)
+
+
 @app.route('/api/bulk-process', methods=['POST'])
 def bulk_process():
-    """Process multiple resumes"""
+    """Start processing every resume in the uploads folder as a background job"""
+    data = request.get_json(silent=True) or {}
     upload_dir = app.config['UPLOAD_FOLDER']
     
+    # Uploads are saved asynchronously; include any still in the queue
+    flush_uploads()
     resume_files = []
     for ext in ['*.pdf', '*.docx', '*.doc']:
         resume_files.extend(glob.glob(os.path.join(upload_dir, ext)))
@@ -269,87 +603,62 @@ def bulk_process():
     if not resume_files:
         return jsonify({'error': 'No resume files found'}), 400
     
-    results = []
-    
-    for fpath in resume_files:
-        try:
-            fname = os.path.basename(fpath)
-            txt = extract_resume(fpath)
-            email = extract_email(txt)
-            phone = extract_phone(txt)
-            skills = extract_skills(txt)
-            jobs = recommend_jobs(skills, get_jobs_db(), top_n=10, min_match=10)
-            
-            avg_match = sum(job['match'] for job in jobs) / len(jobs) if jobs else 0
-            top_match = max(job['match'] for job in jobs) if jobs else 0
-            
-            results.append({
-                'filename': fname,
-                'email': email,
-                'phone': phone,
-                'skills_count': len(skills),
-                'skills': skills,
-                'jobs_found': len(jobs),
-                'avg_match': round(avg_match, 1),
-                'top_match': round(top_match, 1),
-                'top_jobs': jobs[:5]
-            })
-            
-        except Exception as e:
-            results.append({
-                'filename': os.path.basename(fpath),
-                'error': str(e)
-            })
+    job = bulkJobs.submit(resume_files, run_bulk_job)
     
-    # Generate bulk report Excel
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill
-    
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Bulk Processing Results"
-    
-    hdr_fill = PatternFill(start_color="2E7D32", end_color="2E7D32", fill_type="solid")
-    hdr_font = Font(bold=True, color="FFFFFF", size=12)
-    
-    hdrs = ['#', 'Filename', 'Email', 'Phone', 'Skills', 'Jobs Found', 'Avg Match %', 'Top Match %', 'Status']
-    for col, hdr in enumerate(hdrs, start=1):
-        cell = ws.cell(row=1, column=col)
-        cell.value = hdr
-        cell.font = hdr_font
-        cell.fill = hdr_fill
-    
-    for idx, result in enumerate(results, start=2):
-        ws.cell(row=idx, column=1, value=idx-1)
-        ws.cell(row=idx, column=2, value=result['filename'])
-        ws.cell(row=idx, column=3, value=result.get('email', 'N/A'))
-        ws.cell(row=idx, column=4, value=result.get('phone', 'N/A'))
-        ws.cell(row=idx, column=5, value=result.get('skills_count', 0))
-        ws.cell(row=idx, column=6, value=result.get('jobs_found', 0))
-        ws.cell(row=idx, column=7, value=result.get('avg_match', 0))
-        ws.cell(row=idx, column=8, value=result.get('top_match', 0))
-        ws.cell(row=idx, column=9, value='Error' if 'error' in result else 'Success')
-    
-    ws.column_dimensions['A'].width = 5
-    ws.column_dimensions['B'].width = 30
-    ws.column_dimensions['C'].width = 25
-    ws.column_dimensions['D'].width = 15
-    ws.column_dimensions['E'].width = 10
-    ws.column_dimensions['F'].width = 12
-    ws.column_dimensions['G'].width = 12
-    ws.column_dimensions['H'].width = 12
-    ws.column_dimensions['I'].width = 10
-    
-    bulk_fname = f"bulk_processing_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    bulk_path = os.path.join(upload_dir, bulk_fname)
-    wb.save(bulk_path)
+    # Blocking mode for scripts that want the whole batch in one response
+    if data.get('wait'):
+        for _ in job.iter_results():
+            pass
+        status = job.status_dict()
+        return jsonify({
+            'success': status['status'] == 'done',
+            'job_id': job.id,
+            'processed': status['processed'],
+            'results': status['results'],
+            'excel_report': status['excel_report'],
+            'exports': status['exports'],
+            'error': status['error']
+        })
     
     return jsonify({
         'success': True,
-        'processed': len(results),
-        'results': results,
-        'excel_report': bulk_fname
-    })
+        'job_id': job.id,
+        'total': job.total,
+        'status_url': f'/api/bulk-process/{job.id}',
+        'stream_url': f'/api/bulk-process/{job.id}/stream'
+    }), 202
+
+
+@app.route('/api/bulk-process/<job_id>', methods=['GET'])
+def bulk_process_status(job_id):
+    """Report progress and results of a bulk job (?since=N skips the first N results)"""
+    job = bulkJobs.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    since = request.args.get('since', 0, type=int)
+    return jsonify(job.status_dict(since=max(since, 0)))
+
+
+@app.route('/api/bulk-process/<job_id>/stream', methods=['GET'])
+def bulk_process_stream(job_id):
+    """Stream a bulk job's results as NDJSON, one line per resume as it finishes"""
+    job = bulkJobs.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    def generate():
+        for result in job.iter_results():
+            if result is None:
+                yield '\n'  # keep-alive
+                continue
+            yield json.dumps({'type': 'result', 'result': result}) + '\n'
+        status = job.status_dict(since=job.total)
+        yield json.dumps({'type': 'end', 'status': status['status'], 'processed': status['processed'],
+                          'excel_report': status['excel_report'], 'exports': status['exports'],
+                          'error': status['error']}) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 
 @app.route('/api/download-bulk-report/<fname>', methods=['GET'])
@@ -361,6 +670,114 @@ def download_bulk_report(fname):
     return jsonify({'error': 'File not found'}), 404
 
 
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Timers and counters in Prometheus text format (?format=json for percentiles)"""
+    if request.args.get('format') == 'json':
+        return jsonify(metrics.registry.snapshot())
+    return Response(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/api/match-candidates', methods=['POST'])
+def match_candidates():
+    """Rank stored resumes for a job posting or a required_skills list"""
+    if not candidatePool:
+        return jsonify({'error': 'Candidate pool is disabled'}), 404
+    data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Expected a JSON object'}), 400
+    
+    job = data.get('job') or {}
+    if not isinstance(job, dict):
+        return jsonify({'error': 'job must be an object'}), 400
+    job_skills = data.get('required_skills') or job.get('required_skills')
+    if job_skills and not (isinstance(job_skills, list) and all(isinstance(s, str) and s.strip() for s in job_skills)):
+        return jsonify({'error': 'required_skills must be a list of non-empty strings'}), 400
+    title = job.get('title')
+    if title is not None and not isinstance(title, str):
+        return jsonify({'error': 'job title must be a string'}), 400
+    if not job_skills and title:
+        job_skills = extract_skills_from_title(title)
+    if not job_skills:
+        return jsonify({'error': 'Provide required_skills or a job with a title or required_skills'}), 400
+    if isinstance(data.get('top_k'), bool) or isinstance(data.get('min_match'), bool):
+        return jsonify({'error': 'top_k must be an integer and min_match a number'}), 400
+    try:
+        top_k = int(data.get('top_k', 20))
+        min_match = float(data.get('min_match', 10))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'top_k must be an integer and min_match a number'}), 400
+    if top_k < 1 or not 0 <= min_match <= 100:
+        return jsonify({'error': 'top_k must be at least 1 and min_match between 0 and 100'}), 400
+    top_k = min(top_k, app.config['MATCH_CANDIDATES_MAX'])
+    
+    hits = candidatePool.match_job(job_skills, top_k=top_k, min_match=min_match)
+    candidates = [{
+        'candidate_id': cand['id'],
+        'filename': cand['filename'],
+        'email': cand['email'],
+        'phone': cand['phone'],
+        'skills': cand['skills'],
+        'match': round(score, 1),
+        'matching_skills': matching
+    } for cand, score, matching in hits]
+    
+    return jsonify({
+        'success': True,
+        'required_skills': job_skills,
+        'candidates': candidates,
+        'total_candidates': len(candidates),
+        'pool_size': candidatePool.count()
+    })
+
+
+@app.route('/api/candidates/<int:cid>/matches', methods=['GET'])
+def candidate_matches(cid):
+    """A stored candidate's current top job matches"""
+    if not candidatePool:
+        return jsonify({'error': 'Candidate pool is disabled'}), 404
+    cand = candidatePool.get(cid)
+    if not cand:
+        return jsonify({'error': 'Candidate not found'}), 404
+    
+    by_key = {job_key(job): job for job in get_jobs_db()}
+    matches = []
+    for m in candidatePool.matches(cid):
+        job = by_key.get(m['job_key'])
+        if job:
+            matches.append(dict(job, match=round(m['score'], 1),
+                                matched_since=datetime.fromtimestamp(m['added_at']).strftime("%Y-%m-%d %H:%M:%S")))
+    
+    return jsonify({'success': True, 'candidate': cand, 'jobs': matches, 'total_jobs': len(matches)})
+
+
+@app.route('/api/candidates/new-matches', methods=['GET'])
+def candidate_new_matches():
+    """Postings that entered a stored candidate's top matches after ?since= (epoch seconds)"""
+    if not candidatePool:
+        return jsonify({'error': 'Candidate pool is disabled'}), 404
+    since = request.args.get('since', time.time() - 86400, type=float)
+    
+    by_key = {job_key(job): job for job in get_jobs_db()}
+    rows = []
+    for m in candidatePool.new_matches(since):
+        job = by_key.get(m['job_key'])
+        if job:
+            rows.append({
+                'candidate_id': m['candidate_id'],
+                'filename': m['filename'],
+                'email': m['email'],
+                'title': job['title'],
+                'company': job['company'],
+                'location': job.get('location', 'Not specified'),
+                'link': job.get('link', ''),
+                'match': round(m['score'], 1),
+                'matched_at': m['added_at']
+            })
+    
+    return jsonify({'success': True, 'since': since, 'matches': rows, 'total': len(rows)})
+
+
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check"""
@@ -0,0 +1,179 @@
+"""Batch Matching Module - Vectorized scoring of many resumes against many jobs"""
+
+import numpy as np
+
+import metrics
+from job_matcher import norm_skill, is_related, job_result
+
+
+def select_top(keys, ids, k):
+    """
+    Positions of the k largest keys, highest first
+
+    Uses argpartition to avoid a full sort; among equal keys the lower id
+    wins, matching the stable sort used by recommend_jobs.
+    """
+    n = len(keys)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if n > k:
+        part = np.argpartition(-keys, k - 1)
+        kth = keys[part[k - 1]]
+        above = np.flatnonzero(keys > kth)
+        ties = np.flatnonzero(keys == kth)
+        ties = ties[np.argsort(ids[ties], kind='stable')][:k - len(above)]
+        idx = np.concatenate([above, ties])
+    else:
+        idx = np.arange(n)
+    order = np.lexsort((ids[idx], -keys[idx]))
+    return idx[order]
+
+
+class BatchMatcher:
+    """
+    Vectorized resume x job scoring over a shared skill vocabulary
+
+    Jobs are encoded once as a boolean job x skill matrix. For a batch of
+    resumes the exact overlap of every resume with every job is one matrix
+    product, and partial credit comes from a precomputed skill x skill
+    substring relation. Scores are identical to calc_match.
+    """
+
+    def __init__(self, jobs, block_size=8192):
+        self.jobs = jobs
+        self.block_size = block_size
+        self.vocab = {}
+
+        job_low = []
+        for job in jobs:
+            low = [norm_skill(s) for s in job.get('required_skills', [])]
+            job_low.append(low)
+            for skill in low:
+                self.vocab.setdefault(skill, len(self.vocab))
+
+        self.skills = list(self.vocab)
+        self.job_matrix = np.zeros((len(jobs), len(self.vocab)), dtype=bool)
+        self.job_lens = np.zeros(len(jobs))
+        for jid, low in enumerate(job_low):
+            self.job_lens[jid] = len(low)
+            self.job_matrix[jid, [self.vocab[s] for s in low]] = True
+
+        self.rel_rows = {}
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def relation_row(self, skill):
+        """Boolean row of vocabulary skills that a skill partially matches (memoized)"""
+        row = self.rel_rows.get(skill)
+        if row is None:
+            row = np.fromiter((is_related(skill, v) for v in self.skills), dtype=bool, count=len(self.skills))
+            self.rel_rows[skill] = row
+        return row
+
+    def encode(self, resume_skill_lists):
+        """
+        Encode resumes over the batch's distinct skills
+
+        Returns (skills, counts, in_vocab) where counts is a resume x skill
+        matrix of multiplicities and in_vocab holds each skill's vocabulary
+        id, or -1 for skills no job requires.
+        """
+        batch_vocab = {}
+        lows = []
+        for skills in resume_skill_lists:
+            low = [norm_skill(s) for s in skills]
+            lows.append(low)
+            for skill in low:
+                batch_vocab.setdefault(skill, len(batch_vocab))
+
+        counts = np.zeros((len(lows), len(batch_vocab)), dtype=np.float32)
+        for rid, low in enumerate(lows):
+            for skill in low:
+                counts[rid, batch_vocab[skill]] += 1
+
+        skills = list(batch_vocab)
+        in_vocab = np.array([self.vocab.get(s, -1) for s in skills], dtype=np.intp)
+        return skills, counts, in_vocab
+
+    def score_block(self, skills, counts, in_vocab, start, stop):
+        """Match percentages of every encoded resume against jobs[start:stop]"""
+        n_res = counts.shape[0]
+        jobs = self.job_matrix[start:stop].astype(np.float32)
+        lens = self.job_lens[start:stop]
+        scores = np.zeros((n_res, stop - start))
+        if not len(skills) or not len(jobs):
+            return scores
+
+        known = in_vocab >= 0
+        # job x batch-skill presence; skills no job requires are never exact
+        job_has = np.zeros((len(jobs), len(skills)), dtype=np.float32)
+        job_has[:, known] = jobs[:, in_vocab[known]]
+
+        rel = np.stack([self.relation_row(s) for s in skills]).astype(np.float32)
+        # rel_within[k, l]: batch skill k partially matches batch skill l (a job skill)
+        rel_within = np.zeros((len(skills), len(skills)), dtype=np.float32)
+        rel_within[:, known] = rel[:, in_vocab[known]]
+
+        has = counts > 0
+        exact = has.astype(np.float32) @ job_has.T
+        rel_jobs = rel @ jobs.T
+
+        for rid in range(n_res):
+            cols = np.flatnonzero(has[rid])
+            if not len(cols):
+                continue
+            # Related job skills that are not themselves part of the exact overlap
+            outside = rel_jobs[cols] - rel_within[np.ix_(cols, cols)] @ job_has[:, cols].T
+            partial_hit = (outside > 0) & (job_has[:, cols].T == 0)
+            partial = counts[rid, cols].astype(np.float64) @ partial_hit * 0.5
+            total = exact[rid].astype(np.float64) + partial
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pct = np.where(lens > 0, (total / lens) * 100, 0)
+            scores[rid] = np.minimum(pct, 100)
+
+        return scores
+
+    def score_matrix(self, resume_skill_lists):
+        """Full resume x job match-percentage matrix"""
+        skills, counts, in_vocab = self.encode(resume_skill_lists)
+        blocks = [
+            self.score_block(skills, counts, in_vocab, start, min(start + self.block_size, len(self.jobs)))
+            for start in range(0, len(self.jobs), self.block_size)
+        ]
+        if not blocks:
+            return np.zeros((len(resume_skill_lists), 0))
+        return np.hstack(blocks)
+
+    def top_k(self, resume_skill_lists, k=10, min_match=10):
+        """
+        Per-resume top-k jobs, scored block by block
+
+        Returns one list of (job id, score) per resume, ordered like
+        recommend_jobs. Only a running top-k is kept per resume, so memory
+        stays bounded by the block size rather than the job count.
+        """
+        skills, counts, in_vocab = self.encode(resume_skill_lists)
+        best = [(np.empty(0, dtype=np.intp), np.empty(0)) for _ in resume_skill_lists]
+
+        for start in range(0, len(self.jobs), self.block_size):
+            stop = min(start + self.block_size, len(self.jobs))
+            block = self.score_block(skills, counts, in_vocab, start, stop)
+            block_ids = np.arange(start, stop)
+            for rid, row in enumerate(block):
+                keep = row >= min_match
+                ids = np.concatenate([best[rid][0], block_ids[keep]])
+                vals = np.concatenate([best[rid][1], row[keep]])
+                top = select_top(np.round(vals, 1), ids, k)
+                best[rid] = (ids[top], vals[top])
+
+        return [list(zip(ids.tolist(), vals.tolist())) for ids, vals in best]
+
+    def recommend_many(self, resume_skill_lists, top_n=10, min_match=10):
+        """recommend_jobs for a whole batch of resumes at once"""
+        with metrics.timer('job_match_seconds', matcher='batch'):
+            tops = self.top_k(resume_skill_lists, k=top_n, min_match=min_match)
+        return [
+            [job_result(self.jobs[jid], score, skills) for jid, score in top]
+            for skills, top in zip(resume_skill_lists, tops)
+        ]
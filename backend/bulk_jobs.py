@@ -0,0 +1,133 @@
+"""Bulk Jobs Module - Background bulk-processing jobs with progress tracking"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BulkJob:
+    """
+    State of one background bulk-processing run
+
+    Results are appended as each resume finishes, so pollers see partial
+    results and streams can follow along while the batch is still running.
+    """
+
+    def __init__(self, fpaths):
+        self.id = uuid.uuid4().hex
+        self.fpaths = fpaths
+        self.total = len(fpaths)
+        self.status = 'queued'
+        self.results = []
+        self.excel_report = None
+        self.exports = {}
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.cond = threading.Condition()
+
+    @property
+    def done(self):
+        return self.status in ('done', 'failed')
+
+    def start(self):
+        with self.cond:
+            self.status = 'running'
+            self.started_at = time.time()
+            self.cond.notify_all()
+
+    def add_result(self, result):
+        with self.cond:
+            self.results.append(result)
+            self.cond.notify_all()
+
+    def finish(self, excel_report=None, error=None, exports=None):
+        with self.cond:
+            self.status = 'failed' if error else 'done'
+            self.excel_report = excel_report
+            self.exports = exports or {}
+            self.error = error
+            self.finished_at = time.time()
+            self.cond.notify_all()
+
+    def iter_results(self, start=0, poll=15):
+        """
+        Yield results from index `start` as they arrive until the job ends
+
+        Yields None every `poll` seconds without news so streaming
+        responses can send a keep-alive.
+        """
+        idx = start
+        while True:
+            with self.cond:
+                if idx >= len(self.results) and not self.done:
+                    self.cond.wait(poll)
+                new = self.results[idx:]
+                done = self.done
+            if not new and not done:
+                yield None
+            for result in new:
+                yield result
+            idx += len(new)
+            if done and idx >= len(self.results):
+                return
+
+    def status_dict(self, since=0):
+        """Progress snapshot with results from index `since` onwards"""
+        with self.cond:
+            elapsed = (self.finished_at or time.time()) - (self.started_at or self.created_at)
+            return {
+                'job_id': self.id,
+                'status': self.status,
+                'total': self.total,
+                'processed': len(self.results),
+                'progress': round(len(self.results) / self.total * 100, 1) if self.total else 100.0,
+                'elapsed_seconds': round(elapsed, 2),
+                'since': since,
+                'results': self.results[since:],
+                'excel_report': self.excel_report,
+                'exports': self.exports,
+                'error': self.error
+            }
+
+
+class BulkJobManager:
+    """Runs bulk jobs on a small background thread pool and keeps them for polling"""
+
+    def __init__(self, max_workers=2, keep_for=3600):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bulk-job')
+        self.keep_for = keep_for
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def submit(self, fpaths, run):
+        """Queue `run(job)` for a new job over fpaths and return the job"""
+        job = BulkJob(fpaths)
+        with self.lock:
+            self.prune()
+            self.jobs[job.id] = job
+        self.executor.submit(self._run, job, run)
+        return job
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def prune(self):
+        """Forget finished jobs older than keep_for seconds"""
+        cutoff = time.time() - self.keep_for
+        for job_id in [jid for jid, job in self.jobs.items() if job.done and job.finished_at < cutoff]:
+            del self.jobs[job_id]
+
+    def _run(self, job, run):
+        job.start()
+        try:
+            run(job)
+        except Exception as e:
+            print(f"Bulk job {job.id} failed: {e}")
+            job.finish(error=str(e))
+            return
+        if not job.done:
+            job.finish()
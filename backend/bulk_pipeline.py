@@ -0,0 +1,352 @@
+"""Bulk Pipeline Module - Parallel resume parsing for bulk processing"""
+
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+import metrics
+import resume_parser
+from resume_parser import extract_resume, extract_contacts, extract_skills
+from parse_cache import content_digest
+
+
+def parse_resume(src, fname, cache=None):
+    """
+    Extract text, contact fields and skills from one resume
+
+    src may be a path, bytes/memoryview or a binary file-like object such
+    as an upload stream; fname supplies the format and reported filename.
+
+    The result carries the SHA-256 of the file bytes as 'digest', and
+    'truncated' is True when a PDF hit the page/character budget. With a
+    ParseCache, files whose bytes were parsed before skip extraction;
+    if only the skill dictionary changed, skills are re-detected from the
+    cached text.
+    """
+    digest = content_digest(src)
+    if cache:
+        entry = cache.get(digest)
+        metrics.inc('parse_cache_requests_total', result='hit' if entry else 'miss')
+        if entry:
+            if entry['taxonomy'] != resume_parser.skill_matcher.version:
+                entry['skills'] = extract_skills(entry['text'])
+                entry['taxonomy'] = resume_parser.skill_matcher.version
+                cache.put(digest, entry)
+            return {
+                'filename': fname,
+                'email': entry['email'],
+                'phone': entry['phone'],
+                'linkedin': entry['linkedin'],
+                'github': entry['github'],
+                'name': entry['name'],
+                'skills': entry['skills'],
+                'truncated': entry.get('truncated', False),
+                'digest': digest,
+                'cached': True
+            }
+
+    stats = {}
+    txt = extract_resume(src, fname, stats)
+    if stats.get('truncated'):
+        print(f"{fname}: text cut at {stats['pages']} pages / {stats['chars']} chars")
+    with metrics.timer('contact_extract_seconds'):
+        contacts = extract_contacts(txt)
+    parsed = {
+        'filename': fname,
+        'email': contacts['email'],
+        'phone': contacts['phone'],
+        'linkedin': contacts['linkedin'],
+        'github': contacts['github'],
+        'name': contacts['names'][0] if contacts['names'] else None,
+        'skills': extract_skills(txt),
+        'truncated': stats.get('truncated', False),
+        'digest': digest
+    }
+
+    if cache:
+        cache.put(digest, {
+            'text': txt,
+            'email': parsed['email'],
+            'phone': parsed['phone'],
+            'linkedin': parsed['linkedin'],
+            'github': parsed['github'],
+            'name': parsed['name'],
+            'skills': parsed['skills'],
+            'truncated': parsed['truncated'],
+            'taxonomy': resume_parser.skill_matcher.version
+        })
+        parsed['cached'] = False
+
+    return parsed
+
+
+def parse_resume_file(fpath, cache=None):
+    """Extract text, contact fields and skills from one resume file"""
+    return parse_resume(fpath, os.path.basename(fpath), cache)
+
+
+def summarize_result(parsed, jobs):
+    """Combine a parsed resume with its matched jobs into a bulk result row"""
+    avg_match = sum(job['match'] for job in jobs) / len(jobs) if jobs else 0
+    top_match = max(job['match'] for job in jobs) if jobs else 0
+
+    return {
+        'filename': parsed['filename'],
+        'email': parsed['email'],
+        'phone': parsed['phone'],
+        'skills_count': len(parsed['skills']),
+        'skills': parsed['skills'],
+        'jobs_found': len(jobs),
+        'avg_match': round(avg_match, 1),
+        'top_match': round(top_match, 1),
+        'top_jobs': jobs[:5]
+    }
+
+
+def _init_worker(matcher):
+    """Share the parent's skill dictionary with a worker process"""
+    resume_parser.skill_matcher = matcher
+
+
+def _error_result(fpath, msg):
+    return {
+        'filename': os.path.basename(fpath),
+        'error': msg
+    }
+
+
+def _on_alarm(signum, frame):
+    raise TimeoutError('Parse time limit exceeded')
+
+
+def _parse_limited(fpath, cache, timeout):
+    """
+    parse_resume_file inside a worker, interrupted after `timeout` seconds
+
+    The worker enforces the limit itself, so a stuck file never keeps a
+    pool process busy after the parent has given up on it. Returns the
+    result and the cache entries (from a deferred ParseCache) for the
+    parent to store.
+    """
+    if not timeout or not hasattr(signal, 'setitimer'):
+        return parse_resume_file(fpath, cache), cache.pending if cache else []
+    old = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        parsed = parse_resume_file(fpath, cache)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old)
+    return parsed, cache.pending if cache else []
+
+
+def _pool_context():
+    """
+    Start method for parse workers
+
+    The app process runs several threads by the time a bulk job starts,
+    and forking it could hand a worker a lock another thread held.
+    Workers are forked from a single-threaded forkserver instead and get
+    the skill dictionary through the pool initializer. Platforms without
+    forkserver keep their default (spawn).
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return None
+
+
+class _ParsePool:
+    """Process pool for iter_parsed that can be replaced after a worker dies"""
+
+    def __init__(self, workers, cache, timeout):
+        self.workers = workers
+        self.cache = cache
+        # Workers hand their cache writes back so this process keeps the size budget
+        self.worker_cache = cache.deferred() if cache else None
+        self.timeout = timeout
+        self.executor = None
+        self.futures = []
+        self.restart()
+
+    def _shutdown(self):
+        # shutdown(cancel_futures=True) needs Python 3.9
+        for fut in self.futures:
+            fut.cancel()
+        self.futures = []
+        self.executor.shutdown(wait=False)
+
+    def restart(self):
+        if self.executor:
+            self._shutdown()
+            metrics.inc('bulk_pool_restarts_total')
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(resume_parser.skill_matcher,)
+        )
+
+    def submit(self, fpath):
+        fut = self.executor.submit(_parse_limited, fpath, self.worker_cache, self.timeout)
+        self.futures.append(fut)
+        return fut
+
+    def result(self, fut, fpath):
+        """
+        A future's parse result, or an error result for timeouts and failures
+
+        BrokenProcessPool is raised to the caller, which replaces the pool.
+        """
+        try:
+            parsed, pending = fut.result(timeout=self.timeout)
+        except BrokenProcessPool:
+            raise
+        except FutureTimeout:
+            metrics.inc('bulk_parse_failures_total', reason='timeout')
+            return _error_result(fpath, f'Timed out after {self.timeout}s')
+        except Exception as e:
+            metrics.inc('bulk_parse_failures_total', reason='error')
+            return _error_result(fpath, str(e))
+        for digest, entry in pending:
+            try:
+                self.cache.put(digest, entry)
+            except OSError as e:
+                print(f"Could not cache {fpath}: {e}")
+        return parsed
+
+    def close(self):
+        # Workers stop themselves at the time limit, so nothing is left stuck
+        self._shutdown()
+
+
+def iter_parsed(fpaths, workers=None, timeout=60, cache=None):
+    """
+    Parse resume files across a process pool, yielding results in order
+
+    Each file runs in its own task, so an exception only marks that file
+    as failed. A file that takes longer than `timeout` seconds once it is
+    next in line is reported as timed out (workers also stop any parse
+    running past `timeout`) and the rest of the batch keeps going.
+
+    If a worker process dies (segfault, OOM kill), the pool breaks and
+    every unfinished task fails with it. The pool is then replaced, the
+    file being waited on is re-run on its own - it is reported as crashed
+    only if it breaks the pool again - and the unfinished files are
+    resubmitted.
+
+    With workers=1 (or a single file) files are parsed inline in the
+    calling thread and `timeout` is not applied, since a running parse
+    can't be interrupted there.
+
+    Args:
+        fpaths: Resume file paths
+        workers: Worker processes (None = CPU count, 1 = parse inline)
+        timeout: Per-file timeout in seconds
+        cache: Optional ParseCache; workers read it and this process writes it
+
+    Yields:
+        (index, result) pairs in input order
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(fpaths) <= 1:
+        for idx, fpath in enumerate(fpaths):
+            try:
+                yield idx, parse_resume_file(fpath, cache)
+            except Exception as e:
+                metrics.inc('bulk_parse_failures_total', reason='error')
+                yield idx, _error_result(fpath, str(e))
+        return
+
+    pool = _ParsePool(min(workers, len(fpaths)), cache, timeout)
+    try:
+        futures = [pool.submit(fpath) for fpath in fpaths]
+        for idx, fpath in enumerate(fpaths):
+            try:
+                result = pool.result(futures[idx], fpath)
+            except BrokenProcessPool:
+                pool.restart()
+                result = _retry_alone(pool, fpath)
+                # Finished futures keep their results; the rest died with the pool
+                for later in range(idx + 1, len(fpaths)):
+                    fut = futures[later]
+                    if not fut.done() or fut.exception() is not None:
+                        futures[later] = pool.submit(fpaths[later])
+            yield idx, result
+    finally:
+        pool.close()
+
+
+def _retry_alone(pool, fpath):
+    """Re-run a file after a pool crash; if it crashes again it was the cause"""
+    try:
+        return pool.result(pool.submit(fpath), fpath)
+    except BrokenProcessPool:
+        metrics.inc('bulk_parse_failures_total', reason='crash')
+        pool.restart()
+        return _error_result(fpath, 'Worker process crashed')
+
+
+def batched(items, size=32, window=0.5):
+    """
+    Group an iterator's items into lists for batched work, preserving order
+
+    A batch is emitted once it holds `size` items, or `window` seconds
+    after its first item arrived, whichever comes first, so one slow item
+    never holds back results that are already waiting. Items are pulled
+    on a helper thread; exceptions from the iterator are re-raised here.
+    """
+    q = queue.Queue(maxsize=size * 2)
+    stop = threading.Event()
+    done = object()
+
+    def feed():
+        try:
+            for item in items:
+                if stop.is_set():
+                    break
+                q.put((item, None))
+        except Exception as e:
+            q.put((done, e))
+            return
+        finally:
+            if hasattr(items, 'close'):
+                items.close()
+        q.put((done, None))
+
+    threading.Thread(target=feed, name='bulk-batcher', daemon=True).start()
+    batch = []
+    deadline = None
+    try:
+        while True:
+            try:
+                wait = None if deadline is None else max(deadline - time.monotonic(), 0)
+                item, err = q.get(timeout=wait)
+            except queue.Empty:
+                yield batch
+                batch, deadline = [], None
+                continue
+            if item is done:
+                if err is not None:
+                    if batch:
+                        yield batch
+                    raise err
+                break
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + window
+            if len(batch) >= size:
+                yield batch
+                batch, deadline = [], None
+        if batch:
+            yield batch
+    finally:
+        stop.set()
+        # Unblock the feeder if it is waiting on a full queue
+        while not q.empty():
+            q.get_nowait()
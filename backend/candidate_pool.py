@@ -0,0 +1,380 @@
+"""Candidate Pool Module - Stored resumes with incrementally maintained job rankings"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import metrics
+from job_matcher import JobIndex, matching_skills, norm_skill
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL UNIQUE,
+    filename TEXT,
+    email TEXT,
+    phone TEXT,
+    skills TEXT NOT NULL,
+    added_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    skill TEXT NOT NULL,
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    n INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (skill, candidate_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_candidate_skills_candidate ON candidate_skills (candidate_id);
+
+CREATE TABLE IF NOT EXISTS candidate_matches (
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    job_key TEXT NOT NULL,
+    score REAL NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (candidate_id, job_key)
+);
+CREATE INDEX IF NOT EXISTS idx_candidate_matches_job ON candidate_matches (job_key);
+CREATE INDEX IF NOT EXISTS idx_candidate_matches_added ON candidate_matches (added_at);
+
+CREATE TABLE IF NOT EXISTS ranked_jobs (
+    job_key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+);
+"""
+
+
+def job_key(job):
+    """Stable identity of a posting across scrapes, same as the job store's unique key"""
+    return '|'.join([job.get('source', 'unknown'), job['title'].lower(), job['company'].lower()])
+
+
+def job_fingerprint(job):
+    """Hash of the fields scoring and filtering depend on, to spot changed postings"""
+    raw = json.dumps([sorted(job.get('required_skills', [])), job.get('location', '')])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class CandidatePool:
+    """
+    Parsed resumes with each one's top-N job matches kept up to date
+
+    A resume's ranking is computed once when it is added. After that, a
+    job feed change is applied as a delta against the postings the pool
+    last ranked:
+    - added and changed postings are scored against every stored resume
+      through a JobIndex built over just those postings
+    - removed and changed postings are dropped from the saved rankings
+    - only candidates whose full top-N list lost a posting are rescored
+      against the whole feed
+
+    A refresh therefore costs time in proportion to the churn rather than
+    resumes x jobs. Each saved match records when it first appeared, so
+    new fits for existing candidates can be listed.
+
+    Normalized resume skills are also kept as skill -> candidate postings
+    (candidate_skills), so both the delta pass and match_job (job ->
+    candidates) only load resumes sharing a skill with the postings.
+    """
+
+    def __init__(self, path, top_n=20, min_match=10):
+        self.path = path
+        self.top_n = top_n
+        self.min_match = min_match
+        self.local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self.conn() as conn:
+            conn.executescript(SCHEMA)
+            self._index_skills(conn)
+
+    def conn(self):
+        """Connection for the current thread"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA foreign_keys=ON')
+            self.local.conn = conn
+        return conn
+
+    def _index_skills(self, conn, cid=None, skills=None):
+        """Write a candidate's skill postings, or backfill those missing for older rows"""
+        if cid is not None:
+            conn.execute('DELETE FROM candidate_skills WHERE candidate_id = ?', (cid,))
+            rows = [(cid, skills)]
+        else:
+            rows = [(r['id'], json.loads(r['skills'])) for r in conn.execute(
+                'SELECT id, skills FROM candidates WHERE id NOT IN (SELECT candidate_id FROM candidate_skills)')]
+        # n keeps duplicates after normalization, which calc_match counts twice
+        conn.executemany(
+            """
+            INSERT INTO candidate_skills (skill, candidate_id) VALUES (?, ?)
+            ON CONFLICT (skill, candidate_id) DO UPDATE SET n = n + 1
+            """,
+            [(norm_skill(skill), cid) for cid, skills in rows for skill in skills]
+        )
+
+    def sharing(self, conn, index):
+        """
+        {candidate id: normalized skills related to a JobIndex} for candidates sharing one
+
+        Exact and partial hits both need a related job skill, so scoring a
+        candidate against the index with just these skills gives the same
+        result as with its full list.
+        """
+        vocab = [r[0] for r in conn.execute('SELECT DISTINCT skill FROM candidate_skills')]
+        wanted = [skill for skill in vocab if index.related_skills(skill)]
+        found = {}
+        for i in range(0, len(wanted), 500):
+            chunk = wanted[i:i + 500]
+            for cid, skill, n in conn.execute(
+                    f"SELECT candidate_id, skill, n FROM candidate_skills WHERE skill IN ({','.join('?' * len(chunk))})",
+                    chunk):
+                found.setdefault(cid, []).extend([skill] * n)
+        return found
+
+    def load_skills(self, conn, cids):
+        """{candidate id: skills} for a set of ids"""
+        cids = sorted(cids)
+        found = {}
+        for i in range(0, len(cids), 500):
+            chunk = cids[i:i + 500]
+            for r in conn.execute(
+                    f"SELECT id, skills FROM candidates WHERE id IN ({','.join('?' * len(chunk))})", chunk):
+                found[r['id']] = json.loads(r['skills'])
+        return found
+
+    def top_matches(self, index, skills):
+        """
+        (job key, score) of a resume's top_n jobs in an index, best first
+
+        Ties are broken by job key, the order the saved lists are trimmed
+        and read in, so delta passes keep the same jobs a full rescore would.
+        """
+        hits = []
+        cutoff = None
+        for jid, score in index.rank(skills).iter_ranked(self.min_match):
+            if score < self.min_match:
+                continue
+            # Jobs come by rounded score; past the top_n-th one's rounded
+            # score nothing can tie with it any more
+            rounded = round(score, 1)
+            if cutoff is not None and rounded < cutoff:
+                break
+            hits.append((job_key(index.jobs[jid]), score))
+            if len(hits) == self.top_n:
+                cutoff = rounded
+        hits.sort(key=lambda hit: (-hit[1], hit[0]))
+        return hits[:self.top_n]
+
+    def add(self, parsed, index):
+        """
+        Store (or refresh) a parsed resume and its ranking against a JobIndex
+
+        Returns the candidate id. Resumes are keyed by file digest, so
+        re-uploading the same file updates the existing candidate.
+        """
+        now = time.time()
+        with self.conn() as conn:
+            row = conn.execute(
+                """
+                INSERT INTO candidates (digest, filename, email, phone, skills, added_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (digest) DO UPDATE SET
+                    filename = excluded.filename,
+                    email = excluded.email,
+                    phone = excluded.phone,
+                    skills = excluded.skills,
+                    updated_at = excluded.updated_at
+                RETURNING id
+                """,
+                (parsed['digest'], parsed.get('filename'), parsed.get('email'), parsed.get('phone'),
+                 json.dumps(parsed.get('skills', [])), now, now)
+            ).fetchone()
+            self._index_skills(conn, row['id'], parsed.get('skills', []))
+            self._save_ranking(conn, row['id'], self.top_matches(index, parsed.get('skills', [])), now)
+        return row['id']
+
+    def _save_ranking(self, conn, cid, hits, now, seen=None):
+        """Replace a candidate's matches, keeping added_at for pairs it already had"""
+        self._upsert(conn, cid, hits, now, seen)
+        keys = [key for key, _ in hits]
+        conn.execute(
+            f"DELETE FROM candidate_matches WHERE candidate_id = ? AND job_key NOT IN ({','.join('?' * len(keys))})",
+            [cid] + keys
+        )
+
+    def _upsert(self, conn, cid, hits, now, seen=None):
+        """Insert or rescore matches; seen maps (candidate, job key) pairs dropped this pass to their added_at"""
+        seen = seen or {}
+        conn.executemany(
+            """
+            INSERT INTO candidate_matches (candidate_id, job_key, score, added_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT (candidate_id, job_key) DO UPDATE SET score = excluded.score
+            """,
+            [(cid, key, score, seen.get((cid, key), now)) for key, score in hits]
+        )
+
+    def _trim(self, conn, cid):
+        conn.execute(
+            """
+            DELETE FROM candidate_matches WHERE candidate_id = ? AND job_key NOT IN (
+                SELECT job_key FROM candidate_matches WHERE candidate_id = ?
+                ORDER BY score DESC, job_key LIMIT ?
+            )
+            """,
+            (cid, cid, self.top_n)
+        )
+
+    def apply_feed(self, jobs, index=None):
+        """
+        Bring every saved ranking up to date with a new job snapshot
+
+        Args:
+            jobs: The new job list
+            index: Optional JobIndex over jobs, reused for full rescoring
+
+        Returns:
+            Counts of added/changed/removed postings, rescored candidates and
+            newly recorded matches
+        """
+        started = time.time()
+        current = {job_key(job): (job, job_fingerprint(job)) for job in jobs}
+
+        conn = self.conn()
+        # Serialize feed updates across worker processes
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            stored = {r['job_key']: r['fingerprint'] for r in conn.execute('SELECT job_key, fingerprint FROM ranked_jobs')}
+            added = [key for key in current if key not in stored]
+            changed = [key for key in current if key in stored and stored[key] != current[key][1]]
+            removed = [key for key in stored if key not in current]
+            stats = {'added': len(added), 'changed': len(changed), 'removed': len(removed),
+                     'rescored': 0, 'new_matches': 0}
+
+            if added or changed or removed:
+                stats.update(self._apply_delta(conn, current, added, changed, removed, jobs, index))
+
+                conn.executemany('DELETE FROM ranked_jobs WHERE job_key = ?', [(key,) for key in removed])
+                conn.executemany(
+                    'INSERT OR REPLACE INTO ranked_jobs (job_key, fingerprint) VALUES (?, ?)',
+                    [(key, current[key][1]) for key in added + changed]
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        stats['seconds'] = round(time.time() - started, 3)
+        return stats
+
+    def _apply_delta(self, conn, current, added, changed, removed, jobs, index):
+        now = time.time()
+        stale = removed + changed
+
+        # A candidate whose saved list was full and loses a posting may now
+        # qualify for postings that never made its top-N, so it is rescored
+        # in full; shorter lists already held every qualifying posting
+        truncated = set()
+        seen = {}
+        for i in range(0, len(changed), 500):
+            chunk = changed[i:i + 500]
+            marks = ','.join('?' * len(chunk))
+            seen.update(((r[0], r[1]), r[2]) for r in conn.execute(
+                f'SELECT candidate_id, job_key, added_at FROM candidate_matches WHERE job_key IN ({marks})', chunk))
+        for i in range(0, len(stale), 500):
+            chunk = stale[i:i + 500]
+            marks = ','.join('?' * len(chunk))
+            truncated.update(r[0] for r in conn.execute(
+                f"""
+                SELECT candidate_id FROM candidate_matches
+                WHERE candidate_id IN (SELECT candidate_id FROM candidate_matches WHERE job_key IN ({marks}))
+                GROUP BY candidate_id HAVING COUNT(*) >= ?
+                """, chunk + [self.top_n]))
+            conn.execute(f'DELETE FROM candidate_matches WHERE job_key IN ({marks})', chunk)
+
+        # Only candidates sharing a skill with a new or changed posting can gain a match
+        fresh = JobIndex([current[key][0] for key in added + changed])
+        affected = self.sharing(conn, fresh) if len(fresh) else {}
+        rescored = 0
+
+        if truncated:
+            full = index if index is not None else JobIndex(jobs)
+            for cid, skills in self.load_skills(conn, truncated).items():
+                self._save_ranking(conn, cid, self.top_matches(full, skills), now, seen)
+                rescored += 1
+
+        for cid, skills in affected.items():
+            if cid in truncated:
+                continue
+            hits = self.top_matches(fresh, skills)
+            if hits:
+                self._upsert(conn, cid, hits, now, seen)
+                self._trim(conn, cid)
+
+        new_matches = conn.execute('SELECT COUNT(*) FROM candidate_matches WHERE added_at = ?', (now,)).fetchone()[0]
+        return {'rescored': rescored, 'new_matches': new_matches}
+
+    def match_job(self, job_skills, top_k=20, min_match=10):
+        """
+        Rank stored candidates for one posting (job -> candidates)
+
+        Scores use calc_match semantics with the candidate as the resume
+        side. Only candidates sharing an exact or partial skill with the
+        posting are loaded; everyone else would score 0.
+
+        Returns:
+            (candidate row, score, matching skills) for the best top_k
+            candidates scoring at least min_match, best first
+        """
+        with metrics.timer('candidate_match_seconds'):
+            posting = JobIndex([{'required_skills': job_skills}])
+            conn = self.conn()
+            scored = []
+            for cid, low in self.sharing(conn, posting).items():
+                terms, bits = posting.resume_terms(low)
+                score = posting.score(0, terms, bits)
+                if score >= min_match:
+                    scored.append((-round(score, 1), cid, score))
+            scored.sort()
+
+            hits = []
+            for _, cid, score in scored[:top_k]:
+                cand = self.get(cid)
+                hits.append((cand, score, matching_skills(cand['skills'], job_skills)))
+        return hits
+
+    def matches(self, cid):
+        """Saved top-N (job key, score, added_at) for one candidate, best first"""
+        return [dict(r) for r in self.conn().execute(
+            'SELECT job_key, score, added_at FROM candidate_matches WHERE candidate_id = ? ORDER BY score DESC, job_key',
+            (cid,)
+        )]
+
+    def new_matches(self, since, limit=500):
+        """Matches recorded after `since` (epoch seconds), newest first, with candidate details"""
+        return [dict(r) for r in self.conn().execute(
+            """
+            SELECT c.id AS candidate_id, c.filename, c.email, m.job_key, m.score, m.added_at
+            FROM candidate_matches m JOIN candidates c ON c.id = m.candidate_id
+            WHERE m.added_at > ? ORDER BY m.added_at DESC, m.score DESC LIMIT ?
+            """,
+            (since, limit)
+        )]
+
+    def get(self, cid):
+        row = self.conn().execute('SELECT * FROM candidates WHERE id = ?', (cid,)).fetchone()
+        if not row:
+            return None
+        cand = dict(row)
+        cand['skills'] = json.loads(cand['skills'])
+        return cand
+
+    def count(self):
+        return self.conn().execute('SELECT COUNT(*) FROM candidates').fetchone()[0]
@@ -0,0 +1,82 @@
+"""DOCX Reader Module - Streaming DOCX text extraction with zipfile + expat"""
+
+import re
+import zipfile
+from xml.parsers import expat
+
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+HEADER_XML = re.compile(r'word/header[0-9]*.xml')
+FOOTER_XML = re.compile(r'word/footer[0-9]*.xml')
+DOC_XML = 'word/document.xml'
+
+# Same markers docx2txt emits, so downstream extractors see identical text
+TAG_TEXT = {
+    W_NS + ' p': '\n\n',
+    W_NS + ' tab': '\t',
+    W_NS + ' br': '\n',
+    W_NS + ' cr': '\n',
+}
+TAG_RUN_TEXT = W_NS + ' t'
+
+
+def iter_part_text(stream, chunk_size=64 * 1024):
+    """
+    Yield text pieces from one WordprocessingML part as it is parsed
+
+    The part is fed to expat in chunks, so memory stays bounded by the
+    chunk size plus the text of a single chunk rather than the whole XML
+    tree.
+    """
+    out = []
+    in_text = [False]
+
+    def start(tag, attrs):
+        marker = TAG_TEXT.get(tag)
+        if marker:
+            out.append(marker)
+        elif tag == TAG_RUN_TEXT:
+            in_text[0] = True
+
+    def end(tag):
+        if tag == TAG_RUN_TEXT:
+            in_text[0] = False
+
+    def chars(data):
+        if in_text[0]:
+            out.append(data)
+
+    parser = expat.ParserCreate(namespace_separator=' ')
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = chars
+
+    for chunk in iter(lambda: stream.read(chunk_size), b''):
+        parser.Parse(chunk, False)
+        if out:
+            yield ''.join(out)
+            out.clear()
+    parser.Parse(b'', True)
+    if out:
+        yield ''.join(out)
+
+
+def iter_docx_text(src):
+    """
+    Yield the text of a DOCX (headers, body, footers) piece by piece
+
+    Args:
+        src: Path or binary file-like object of the .docx archive
+    """
+    with zipfile.ZipFile(src) as zipf:
+        names = zipf.namelist()
+        parts = [n for n in names if HEADER_XML.match(n)] + [DOC_XML] + [n for n in names if FOOTER_XML.match(n)]
+        for name in parts:
+            with zipf.open(name) as stream:
+                yield from iter_part_text(stream)
+
+
+def docx_text(src):
+    """Full text of a DOCX, matching docx2txt.process output (without images)"""
+    return ''.join(iter_docx_text(src)).strip()
@@ -0,0 +1,326 @@
+"""Job Cache Module - Stale-while-revalidate cache for scraped jobs"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+import metrics
+from job_matcher import compact_job, norm_skill
+
+
+def _fmt(ts):
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else None
+
+
+def _ranked(counter, names=None):
+    """Counter as [{'value', 'count'}], most common first, ties by name"""
+    return [{'value': names[key] if names else key, 'count': n}
+            for key, n in sorted(counter.items(), key=lambda kv: (-kv[1], kv[0]))]
+
+
+def build_facets(jobs):
+    """
+    Location, skill and source counts over a job snapshot
+
+    Skills are counted case-insensitively and reported with the first
+    spelling seen. The ETag only depends on the counts.
+    """
+    locs = Counter()
+    skills = Counter()
+    skill_names = {}
+    sources = Counter()
+
+    for job in jobs:
+        loc = job.get('location') or 'Not specified'
+        if loc != 'Not specified':
+            locs[loc] += 1
+        sources[job.get('source') or 'unknown'] += 1
+        for key, name in {norm_skill(s): s.strip() for s in job.get('required_skills', [])}.items():
+            skills[key] += 1
+            skill_names.setdefault(key, name)
+
+    facets = {
+        'jobs_count': len(jobs),
+        'locations': _ranked(locs),
+        'skills': _ranked(skills, skill_names),
+        'sources': _ranked(sources)
+    }
+    facets['etag'] = hashlib.sha1(json.dumps(facets, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    facets['generated_at'] = _fmt(time.time())
+    return facets
+
+
+class JobCache:
+    """
+    Job snapshot that is served stale while a refresh runs in the background
+
+    Only the very first load (or a forced refresh) blocks the caller. Once
+    the snapshot is older than `ttl`, callers keep getting it and a single
+    background refresh is started; concurrent callers join that refresh
+    instead of scraping again. An optional scheduler refreshes the cache
+    shortly before it expires so requests rarely see stale data at all.
+
+    With a JobStore the snapshot is persisted, loaded on a cold start and
+    shared between worker processes: a worker whose snapshot expires first
+    checks whether another worker already refreshed the store, and only
+    the worker holding the store's refresh lease scrapes.
+
+    Facet counts (see build_facets) are rebuilt whenever the snapshot is
+    replaced, so requests never aggregate the job list themselves. New
+    snapshots also go through compact_job, so repeated strings are shared.
+    """
+
+    def __init__(self, loader, ttl=1800, store=None):
+        """
+        Args:
+            loader: Callable taking an `on_late(jobs)` callback and returning
+                the freshly scraped jobs; on_late may be called later with a
+                fuller list from slow sources
+            ttl: Seconds before the snapshot counts as stale
+            store: Optional JobStore to persist and share jobs through
+        """
+        self.loader = loader
+        self.ttl = ttl
+        self.store = store
+        self.jobs = []
+        self.facets = build_facets([])
+        self.updated_at = 0
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.inflight = None
+        self.scheduler = None
+        self.next_prewarm_at = None
+        self.listeners = []
+        self.stats = {
+            'refresh_count': 0,
+            'refresh_errors': 0,
+            'stale_served': 0,
+            'last_refresh_started': None,
+            'last_refresh_seconds': None,
+            'last_error': None,
+        }
+
+    def add_listener(self, fn):
+        """Call fn(jobs) whenever the snapshot is replaced"""
+        self.listeners.append(fn)
+
+    def _notify(self, jobs):
+        for fn in self.listeners:
+            try:
+                fn(jobs)
+            except Exception as e:
+                print(f"Job cache listener failed: {e}")
+
+    def age(self):
+        return time.time() - self.updated_at if self.updated_at > 0 else 0
+
+    def is_fresh(self):
+        return bool(self.jobs) and self.age() < self.ttl
+
+    def get(self, force_refresh=False):
+        """Current jobs; blocks only on the first load or when forced"""
+        if not self.jobs and self.store and not force_refresh:
+            self.load_from_store()
+
+        if force_refresh or not self.jobs:
+            metrics.inc('job_cache_requests_total', result='refresh' if force_refresh else 'miss')
+            return self.refresh(force=force_refresh)
+
+        if not self.is_fresh():
+            metrics.inc('job_cache_requests_total', result='stale')
+            self.stats['stale_served'] += 1
+            if self.refresh_async():
+                print(f"Serving stale jobs ({int(self.age() / 60)} min old), refreshing in background")
+        else:
+            metrics.inc('job_cache_requests_total', result='fresh')
+            print(f"Using cached jobs (cached {int(self.age() / 60)} min ago)")
+
+        return self.jobs
+
+    def load_from_store(self):
+        """Replace the snapshot with the store's live jobs; True if any were found"""
+        jobs = self.store.all_jobs()
+        if not jobs:
+            return False
+        jobs = [compact_job(job) for job in jobs]
+        facets = build_facets(jobs)
+        with self.lock:
+            self.jobs = jobs
+            self.facets = facets
+            self.updated_at = self.store.refreshed_at()
+            self.generation += 1
+        print(f"Loaded {len(jobs)} jobs from store")
+        self._notify(jobs)
+        return True
+
+    def set(self, jobs):
+        """Replace the snapshot, e.g. after a manual scrape"""
+        jobs = self._persist(jobs)
+        jobs = [compact_job(job) for job in jobs]
+        facets = build_facets(jobs)
+        with self.lock:
+            self.jobs = jobs
+            self.facets = facets
+            self.updated_at = time.time()
+            self.generation += 1
+        self._notify(jobs)
+
+    def _persist(self, jobs):
+        """
+        Store a fresh job list and return the snapshot to serve
+
+        The store only keeps live postings; fallback postings are served
+        from memory alongside them. A scrape with no live postings at all
+        leaves the store's snapshot untouched.
+        """
+        if not self.store:
+            return jobs
+        live = [job for job in jobs if not job.get('is_fallback')]
+        if not live:
+            self.store.release_refresh()
+            return jobs
+        self.store.upsert(live)
+        return self.store.all_jobs() + [job for job in jobs if job.get('is_fallback')]
+
+    def refresh(self, force=True):
+        """Refresh now, joining an in-flight refresh if there is one"""
+        self._start_refresh(force)[0].join()
+        return self.jobs
+
+    def refresh_async(self):
+        """Start a background refresh unless one is running; True if started"""
+        return self._start_refresh(False)[1]
+
+    def _start_refresh(self, force):
+        """Single-flight refresh thread, returned with whether it was just started"""
+        with self.lock:
+            if self.inflight is not None:
+                return self.inflight, False
+            self.inflight = threading.Thread(target=self._run_refresh, args=(force,),
+                                             name='job-cache-refresh', daemon=True)
+            self.inflight.start()
+            return self.inflight, True
+
+    def _sync_from_store(self, force):
+        """
+        Pick up another worker's refresh instead of scraping
+
+        Returns True when this worker should not scrape: the store was
+        refreshed since our snapshot, or another worker holds the lease.
+        """
+        refreshed_at = self.store.refreshed_at()
+        if not force and refreshed_at > self.updated_at and time.time() - refreshed_at < self.ttl:
+            return self.load_from_store()
+
+        if self.store.claim_refresh():
+            return False
+
+        print("Another worker is refreshing jobs")
+        # With nothing to serve, wait for that worker rather than scraping twice
+        deadline = time.time() + 60
+        while not self.jobs and time.time() < deadline:
+            time.sleep(0.5)
+            if self.store.refreshed_at() > refreshed_at:
+                return self.load_from_store()
+        return bool(self.jobs)
+
+    def _run_refresh(self, force=False):
+        started = time.time()
+        self.stats['last_refresh_started'] = started
+        committed = {}
+        # Set once this refresh has committed (or failed), so late results
+        # that arrive early are attached to the right generation
+        settled = threading.Event()
+
+        if self.store:
+            try:
+                if self._sync_from_store(force):
+                    with self.lock:
+                        self.inflight = None
+                    return
+            except Exception as e:
+                print(f"Job store check failed: {e}")
+
+        def on_late(jobs):
+            settled.wait()
+            # Ignore late results once a newer snapshot has replaced this one
+            with self.lock:
+                if committed.get('generation') != self.generation or not jobs:
+                    return
+            jobs = self._persist(jobs)
+            jobs = [compact_job(job) for job in jobs]
+            facets = build_facets(jobs)
+            with self.lock:
+                if committed.get('generation') != self.generation:
+                    return
+                self.jobs = jobs
+                self.facets = facets
+                # A new snapshot, so caches keyed by generation must not reuse the old one
+                self.generation += 1
+                committed['generation'] = self.generation
+            print(f"Merged late scrape results, now {len(jobs)} jobs")
+            self._notify(jobs)
+
+        try:
+            jobs = self.loader(on_late)
+            jobs = self._persist(jobs)
+            jobs = [compact_job(job) for job in jobs]
+            facets = build_facets(jobs)
+            with self.lock:
+                self.jobs = jobs
+                self.facets = facets
+                self.updated_at = time.time()
+                self.generation += 1
+                committed['generation'] = self.generation
+            self._notify(jobs)
+            self.stats['refresh_count'] += 1
+            self.stats['last_error'] = None
+        except Exception as e:
+            print(f"Job refresh failed: {e}")
+            if self.store:
+                self.store.release_refresh()
+            self.stats['refresh_errors'] += 1
+            self.stats['last_error'] = str(e)
+        finally:
+            settled.set()
+            metrics.observe('job_cache_refresh_seconds', time.time() - started)
+            self.stats['last_refresh_seconds'] = round(time.time() - started, 2)
+            with self.lock:
+                self.inflight = None
+
+    def start_scheduler(self, lead=120):
+        """Pre-warm the cache `lead` seconds before each expiry in a daemon thread"""
+        if self.scheduler is not None:
+            return
+
+        def loop():
+            while True:
+                self.next_prewarm_at = (self.updated_at or time.time()) + max(self.ttl - lead, 1)
+                time.sleep(max(self.next_prewarm_at - time.time(), 1))
+                if self.age() >= self.ttl - lead or not self.jobs:
+                    print("Pre-warming job cache...")
+                    self.refresh(force=False)
+
+        self.scheduler = threading.Thread(target=loop, name='job-cache-prewarm', daemon=True)
+        self.scheduler.start()
+
+    def status(self):
+        """Timing data for /api/cache-status"""
+        return {
+            'refreshing': self.inflight is not None,
+            'store': self.store.path if self.store else None,
+            'store_refreshed_at': _fmt(self.store.refreshed_at()) if self.store else None,
+            'store_jobs': self.store.count() if self.store else None,
+            'generation': self.generation,
+            'refresh_count': self.stats['refresh_count'],
+            'refresh_errors': self.stats['refresh_errors'],
+            'stale_served': self.stats['stale_served'],
+            'last_refresh_started': _fmt(self.stats['last_refresh_started']),
+            'last_refresh_seconds': self.stats['last_refresh_seconds'],
+            'last_error': self.stats['last_error'],
+            'expires_at': _fmt(self.updated_at + self.ttl) if self.updated_at else None,
+            'next_prewarm_at': _fmt(self.next_prewarm_at) if self.scheduler else None,
+        }
@@ -1,5 +1,13 @@
 """Job Matching Module - Handles job matching and filtering logic"""
 
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+import metrics
+
 
 def calc_match(resume_skills, job_skills):
     """Calculate match percentage between resume and job skills"""
@@ -25,13 +33,378 @@ def calc_match(resume_skills, job_skills):
     return min(pct, 100)
 
 
+def norm_skill(skill):
+    """Normalize a skill for matching"""
+    return skill.lower().strip()
+
+
+def is_related(a, b):
+    """True when one skill contains the other (exact or partial match)"""
+    return a in b or b in a
+
+
+def matching_skills(resume_skills, job_skills):
+    """Job skills that match any resume skill, in resume order"""
+    matching = []
+    for rs in resume_skills:
+        for js in job_skills:
+            if rs.lower() == js.lower() or rs.lower() in js.lower() or js.lower() in rs.lower():
+                if js not in matching:
+                    matching.append(js)
+    return matching
+
+
+def job_result(job, score, resume_skills):
+    """Build the match dict returned to the API for one job"""
+    return {
+        'title': job['title'],
+        'company': job['company'],
+        'location': job.get('location', 'Not specified'),
+        'description': job['description'],
+        'match': round(score, 1),
+        'matching_skills': matching_skills(resume_skills, job['required_skills']),
+        'link': job.get('link', ''),
+        'required_skills': job['required_skills']
+    }
+
+
+class SkillVocab:
+    """
+    Vocabulary giving every normalized skill of one job snapshot a small int id
+
+    Each JobIndex builds its own, so bit positions stay dense for the live
+    postings (bit i set = skill i required) and skills that left the feed
+    are dropped together with the old index instead of widening every
+    later bitmask.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, skill):
+        """Id of a normalized skill, adding it if new"""
+        sid = self.ids.get(skill)
+        if sid is None:
+            sid = len(self.names)
+            self.names.append(sys.intern(skill))
+            self.ids[self.names[sid]] = sid
+        return sid
+
+    def get(self, skill):
+        """Id of a normalized skill, or None when no job has required it"""
+        return self.ids.get(skill)
+
+
+# Non-indexed skills whose related-skill sets each JobIndex remembers
+RELATED_CACHE_SIZE = 2048
+
+INTERNED_FIELDS = ('source', 'company', 'location', 'link', 'scraped_at')
+
+
+def compact_job(job):
+    """
+    Share repeated strings between postings (in place)
+
+    Postings loaded from JSON or SQLite get their own copy of every
+    source, company, location and skill string; interning them keeps one
+    copy per distinct value for the lifetime of the job cache.
+    """
+    for field in INTERNED_FIELDS:
+        value = job.get(field)
+        if type(value) is str:
+            job[field] = sys.intern(value)
+    skills = job.get('required_skills')
+    if skills:
+        job['required_skills'] = [sys.intern(s) for s in skills]
+    return job
+
+
+def popcount(bits):
+    """Number of set bits (int.bit_count needs Python 3.10)"""
+    return bin(bits).count('1')
+
+
+class JobIndex:
+    """
+    Inverted skill index over a list of jobs
+
+    Skills are normalized and interned into the index's own SkillVocab
+    once, when the index is built. Each posting is stored as a bitmask of skill ids plus its skill
+    count, postings lists map skill ids to job ids, and which skills
+    partially match each other is precomputed, so scoring only touches
+    jobs that share at least one (exact or partial) skill with the resume
+    and works on ints rather than strings. Scores are identical to
+    calc_match.
+    """
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.vocab = vocab = SkillVocab()
+        self.job_bits = []
+        self.job_lens = array('H')
+        self.job_locs = []
+        self.postings = {}
+
+        for jid, job in enumerate(jobs):
+            ids = [vocab.intern(norm_skill(s)) for s in job.get('required_skills', [])]
+            bits = 0
+            for sid in ids:
+                bits |= 1 << sid
+            self.job_bits.append(bits)
+            self.job_lens.append(len(ids))
+            self.job_locs.append(sys.intern(job.get('location', '').lower()))
+            for sid in set(ids):
+                self.postings.setdefault(sid, array('i')).append(jid)
+
+        # Indexed skills are resolved up front; anything else (resume or
+        # filter skills) goes through a bounded LRU
+        self.related = {}
+        self.extra = OrderedDict()
+        self.extra_lock = threading.Lock()
+        for sid in self.postings:
+            self.related[vocab.names[sid]] = self._resolve(vocab.names[sid])
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def _resolve(self, skill):
+        names = self.vocab.names
+        ids = tuple(sid for sid in self.postings if is_related(skill, names[sid]))
+        bits = 0
+        for sid in ids:
+            bits |= 1 << sid
+        return ids, bits
+
+    def _related(self, skill):
+        """(ids, bitmask) of indexed skills matching a skill exactly or partially (memoized)"""
+        rel = self.related.get(skill)
+        if rel is not None:
+            return rel
+        with self.extra_lock:
+            rel = self.extra.get(skill)
+            if rel is not None:
+                self.extra.move_to_end(skill)
+                return rel
+        rel = self._resolve(skill)
+        with self.extra_lock:
+            self.extra[skill] = rel
+            while len(self.extra) > RELATED_CACHE_SIZE:
+                self.extra.popitem(last=False)
+        return rel
+
+    def related_skills(self, skill):
+        """Ids of indexed skills that match a normalized skill exactly or partially"""
+        return self._related(skill)[0]
+
+    def resume_terms(self, resume_skills):
+        """
+        Precompute a resume for scoring
+
+        Returns (terms, bits): one (skill bit, related skill bitmask) pair
+        per resume skill, where the skill bit is 0 for skills no job has
+        required, and the bitmask of the resume's known skill ids.
+        """
+        terms = []
+        bits = 0
+        for s in resume_skills:
+            low = norm_skill(s)
+            sid = self.vocab.get(low)
+            sbit = 1 << sid if sid is not None else 0
+            bits |= sbit
+            terms.append((sbit, self._related(low)[1]))
+        return terms, bits
+
+    def candidates(self, resume_skills):
+        """Ids of jobs sharing at least one related skill with the resume"""
+        jids = set()
+        for rs in set(norm_skill(s) for s in resume_skills):
+            for sid in self.related_skills(rs):
+                jids.update(self.postings[sid])
+        return jids
+
+    def score(self, jid, terms, resume_bits):
+        """Match percentage of one indexed job, same semantics as calc_match"""
+        n = self.job_lens[jid]
+        if not n or not terms:
+            return 0
+        job_bits = self.job_bits[jid]
+        exact = resume_bits & job_bits
+        # Job skills a partial match can still land on
+        rest = job_bits & ~exact
+
+        partial = 0
+        if rest:
+            for sbit, rel in terms:
+                if rel & rest and not sbit & exact:
+                    partial += 0.5
+
+        pct = ((popcount(exact) + partial) / n) * 100
+        return min(pct, 100)
+
+    def score_all(self, resume_skills):
+        """Scores of every job sharing a skill with the resume, keyed by job id"""
+        terms, bits = self.resume_terms(resume_skills)
+        return {jid: self.score(jid, terms, bits) for jid in self.candidates(resume_skills)}
+
+    def rank(self, resume_skills):
+        """Score every job for one resume once; views are served from the result"""
+        with metrics.timer('job_match_seconds', matcher='index'):
+            return MatchResult(self, resume_skills, self.score_all(resume_skills))
+
+    def make_filter(self, loc_filter=None, skill_filter=None):
+        """
+        Predicate over job ids for the location and skill filters
+
+        A job passes the skill filter when any of its skills matches any
+        filter skill exactly or partially. Returns None when unfiltered.
+        """
+        if not loc_filter and not skill_filter:
+            return None
+
+        loc_low = loc_filter.lower() if loc_filter else None
+        wanted = 0
+        for sf in skill_filter or []:
+            wanted |= self._related(norm_skill(sf))[1]
+
+        def check(jid):
+            if loc_low and loc_low not in self.job_locs[jid]:
+                return False
+            if skill_filter and not wanted & self.job_bits[jid]:
+                return False
+            return True
+
+        return check
+
+
+class MatchResult:
+    """
+    All job scores for one resume
+
+    Built by JobIndex.rank. Jobs are ordered like recommend_jobs orders
+    them (rounded score descending, then job order), so thresholded and
+    filtered views, fallbacks and facet lists are just walks over the same
+    ranking instead of fresh scoring passes.
+    """
+
+    def __init__(self, index, resume_skills, scores):
+        self.index = index
+        self.resume_skills = resume_skills
+        self.scores = scores
+        self._ranked = None
+        self._ranked_ids = None
+        self._tail = None
+        self._rows = {}
+
+    def ranked(self):
+        """(job id, score, rounded score) for jobs with a non-zero rounded score, best first"""
+        if self._ranked is None:
+            ranked, tail = [], []
+            for jid, score in self.scores.items():
+                rounded = round(score, 1)
+                if rounded > 0:
+                    ranked.append((jid, score, rounded))
+                else:
+                    tail.append(jid)
+            ranked.sort(key=lambda hit: (-hit[2], hit[0]))
+            self._ranked = ranked
+            self._tail = sorted(tail)
+        return self._ranked
+
+    def iter_ranked(self, min_match=10):
+        """(job id, score) in rank order, stopping once the rest must score below min_match"""
+        for jid, score, rounded in self.ranked():
+            # Rounded scores only go down from here, so nothing later can qualify
+            if rounded + 0.05 < min_match:
+                return
+            yield jid, score
+
+        # Everything else ties at a rounded score of 0 and keeps job order
+        if min_match <= 0:
+            if self._ranked_ids is None:
+                self._ranked_ids = {hit[0] for hit in self._ranked}
+            for jid in range(len(self.index)):
+                if jid not in self._ranked_ids:
+                    yield jid, self.scores.get(jid, 0)
+        else:
+            for jid in self._tail:
+                yield jid, self.scores[jid]
+
+    def row(self, jid, score):
+        """API dict for one job, built once per job"""
+        row = self._rows.get(jid)
+        if row is None:
+            row = self._rows[jid] = job_result(self.index.jobs[jid], score, self.resume_skills)
+        return row
+
+    def top(self, top_n=10, min_match=10, loc_filter=None, skill_filter=None):
+        """Best top_n jobs scoring at least min_match that pass the filters"""
+        if top_n <= 0:
+            return []
+        passes = self.index.make_filter(loc_filter, skill_filter)
+        hits = []
+        for jid, score in self.iter_ranked(min_match):
+            if score >= min_match and (passes is None or passes(jid)):
+                hits.append(self.row(jid, score))
+                if len(hits) >= top_n:
+                    break
+        return hits
+
+
+class MatchCache:
+    """
+    LRU cache of MatchResults keyed by job snapshot and resume skills
+
+    Keys are the job cache generation plus the normalized resume skills.
+    Entries expire after `ttl` seconds and are ignored once the JobIndex
+    they were scored against has been replaced, so repeated filter
+    requests for one resume only re-run MatchResult.top's post-filters.
+    """
+
+    def __init__(self, maxsize=256, ttl=600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def rank(self, index, resume_skills, generation=None):
+        """Cached index.rank(resume_skills)"""
+        key = (generation, tuple(norm_skill(s) for s in resume_skills))
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry[0].index is index and entry[1] > now:
+                self.entries.move_to_end(key)
+                metrics.inc('match_cache_requests_total', result='hit')
+                return entry[0]
+
+        metrics.inc('match_cache_requests_total', result='miss')
+        result = index.rank(resume_skills)
+        with self.lock:
+            self.entries[key] = (result, now + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
 def recommend_jobs(resume_skills, jobs_db, top_n=10, min_match=10, loc_filter=None, skill_filter=None):
     """
     Recommend jobs based on resume skills
     
     Args:
         resume_skills: List of skills from resume
-        jobs_db: List of available jobs
+        jobs_db: List of available jobs, or a JobIndex built over them
         top_n: Number of top jobs to return
         min_match: Minimum match percentage
         loc_filter: Location filter
@@ -40,50 +413,13 @@ def recommend_jobs(resume_skills, jobs_db, top_n=10, min_match=10, loc_filter=No
     Returns:
         List of matched jobs sorted by match percentage
     """
-    matches = []
+    index = jobs_db if isinstance(jobs_db, JobIndex) else JobIndex(jobs_db)
     
-    print(f"Got {len(jobs_db)} jobs from db")
+    print(f"Got {len(index)} jobs from db")
     print(f"Resume skills: {resume_skills}")
     
-    for job in jobs_db:
-        score = calc_match(resume_skills, job['required_skills'])
-        
-        resume_low = [s.lower().strip() for s in resume_skills]
-        job_low = [s.lower().strip() for s in job['required_skills']]
-        matching = []
-        
-        for rs in resume_skills:
-            for js in job['required_skills']:
-                if rs.lower() == js.lower() or rs.lower() in js.lower() or js.lower() in rs.lower():
-                    if js not in matching:
-                        matching.append(js)
-        
-        if loc_filter and loc_filter.lower() not in job.get('location', '').lower():
-            continue
-            
-        if skill_filter:
-            filter_low = [s.lower().strip() for s in skill_filter]
-            has_skill = any(
-                any(sf in js or js in sf for js in job_low)
-                for sf in filter_low
-            )
-            if not has_skill:
-                continue
-        
-        if score >= min_match:
-            matches.append({
-                'title': job['title'],
-                'company': job['company'],
-                'location': job.get('location', 'Not specified'),
-                'description': job['description'],
-                'match': round(score, 1),
-                'matching_skills': matching,
-                'link': job.get('link', ''),
-                'required_skills': job['required_skills']
-            })
-    
-    matches.sort(key=lambda x: x['match'], reverse=True)
+    matches = index.rank(resume_skills).top(top_n, min_match, loc_filter, skill_filter)
     
-    print(f"Returning {len(matches[:top_n])} jobs (filtered from {len(matches)} matches)")
+    print(f"Returning {len(matches)} jobs")
     
-    return matches[:top_n]
+    return matches
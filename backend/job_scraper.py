@@ -1,8 +1,12 @@
 """Job Scraping Module - Handles multi-source job scraping"""
 
-import requests
 from bs4 import BeautifulSoup
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import metrics
+from scrape_transport import http_get
 
 
 def extract_skills_from_title(title):
@@ -55,7 +59,7 @@ def scrape_indeed(kw="software engineer", loc="", max_jobs=20):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         }
         
-        resp = requests.get(url, headers=hdrs, timeout=10)
+        resp = http_get('indeed', url, headers=hdrs)
         
         if resp.status_code == 200:
             soup = BeautifulSoup(resp.content, 'html.parser')
@@ -96,7 +100,7 @@ def scrape_remote_ok(kw="software", max_jobs=20):
     try:
         url = "https://remoteok.com/api"
         hdrs = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        resp = requests.get(url, headers=hdrs, timeout=10)
+        resp = http_get('remoteok', url, headers=hdrs)
         
         if resp.status_code == 200:
             data = resp.json()
@@ -142,7 +146,7 @@ def scrape_naukri(kw="software engineer", loc="", max_jobs=20):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         }
         
-        resp = requests.get(url, headers=hdrs, timeout=10)
+        resp = http_get('naukri', url, headers=hdrs)
         
         if resp.status_code == 200:
             soup = BeautifulSoup(resp.content, 'html.parser')
@@ -185,7 +189,7 @@ def scrape_instahyre(kw="software", max_jobs=20):
     try:
         url = f"https://www.instahyre.com/search-jobs/?q={kw.replace(' ', '+')}"
         hdrs = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        resp = requests.get(url, headers=hdrs, timeout=10)
+        resp = http_get('instahyre', url, headers=hdrs)
         
         if resp.status_code == 200:
             soup = BeautifulSoup(resp.content, 'html.parser')
@@ -248,30 +252,24 @@ def get_fallback_jobs():
     return ind_jobs + intl_jobs
 
 
-def scrape_jobs_multi(kw="software developer", loc="", max_jobs=20):
-    """Scrape jobs from multiple sources"""
+def merge_sources(results, max_jobs=20):
+    """
+    Combine per-source scrape results in source order
+
+    Indeed only counts when the primary sources came up short, fallback
+    jobs are added when fewer than 10 jobs were found, and duplicates by
+    (title, company) are dropped.
+    """
     all_jobs = []
-    
-    print("Trying Naukri.com...")
-    naukri = scrape_naukri(kw, loc or "india", max_jobs=8)
-    all_jobs.extend(naukri)
-    
-    print("Trying Instahyre...")
-    insta = scrape_instahyre(kw, max_jobs=5)
-    all_jobs.extend(insta)
-    
-    print("Trying RemoteOK...")
-    remote = scrape_remote_ok(kw.split()[0], max_jobs=7)
-    all_jobs.extend(remote)
+    for name in ('naukri', 'instahyre', 'remoteok'):
+        all_jobs.extend(dict(job, source=name) for job in results.get(name, []))
     
     if len(all_jobs) < max_jobs:
-        print("Trying Indeed...")
-        indeed = scrape_indeed(kw, loc, max_jobs=5)
-        all_jobs.extend(indeed)
+        all_jobs.extend(dict(job, source='indeed') for job in results.get('indeed', []))
     
     if len(all_jobs) < 10:
         print("Adding fallback jobs...")
-        all_jobs.extend(get_fallback_jobs())
+        all_jobs.extend(dict(job, source='fallback', is_fallback=True) for job in get_fallback_jobs())
     
     # Remove duplicates
     seen = set()
@@ -283,3 +281,65 @@ def scrape_jobs_multi(kw="software developer", loc="", max_jobs=20):
             unique.append(job)
     
     return unique[:max_jobs]
+
+
+def timed_source(name, fn, *args, **kwargs):
+    """Run one scraper, recording its latency and job count"""
+    with metrics.timer('scrape_source_seconds', source=name):
+        jobs = fn(*args, **kwargs)
+    metrics.inc('scrape_jobs_total', len(jobs), source=name)
+    return jobs
+
+
+def scrape_jobs_multi(kw="software developer", loc="", max_jobs=20, deadline=15, on_late=None):
+    """
+    Scrape jobs from multiple sources concurrently
+    
+    All sources are fetched in parallel. Indeed is started alongside the
+    others but, as before, only used when the other sources return fewer
+    than max_jobs.
+    
+    Args:
+        kw: Search keywords
+        loc: Location
+        max_jobs: Maximum number of jobs to return
+        deadline: Seconds to wait before returning whatever has arrived
+        on_late: Called with the full merged job list once sources that
+            missed the deadline have finished
+    
+    Returns:
+        List of unique jobs from the sources that answered in time
+    """
+    sources = {
+        'naukri': (scrape_naukri, (kw, loc or "india"), {'max_jobs': 8}),
+        'instahyre': (scrape_instahyre, (kw,), {'max_jobs': 5}),
+        'remoteok': (scrape_remote_ok, (kw.split()[0] if kw.split() else kw,), {'max_jobs': 7}),
+        'indeed': (scrape_indeed, (kw, loc), {'max_jobs': 5}),
+    }
+    
+    print(f"Scraping {', '.join(sources)} concurrently...")
+    executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='scrape')
+    futures = {executor.submit(timed_source, name, fn, *args, **kwargs): name
+               for name, (fn, args, kwargs) in sources.items()}
+    done, pending = wait(futures, timeout=deadline)
+    executor.shutdown(wait=False)
+    
+    results = {futures[fut]: fut.result() for fut in done}
+    jobs = merge_sources(results, max_jobs)
+    
+    if pending:
+        late = ', '.join(futures[fut] for fut in pending)
+        for fut in pending:
+            metrics.inc('scrape_late_total', source=futures[fut])
+        print(f"Deadline of {deadline}s reached, still waiting on: {late}")
+        if on_late:
+            def merge_late():
+                wait(pending)
+                for fut in pending:
+                    results[futures[fut]] = fut.result()
+                print(f"Late results arrived from: {late}")
+                on_late(merge_sources(results, max_jobs))
+            
+            threading.Thread(target=merge_late, daemon=True).start()
+    
+    return jobs
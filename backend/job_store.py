@@ -0,0 +1,209 @@
+"""Job Store Module - Persistent SQLite store for scraped jobs"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    company_key TEXT NOT NULL,
+    location TEXT,
+    location_key TEXT,
+    description TEXT,
+    link TEXT,
+    required_skills TEXT,
+    is_fallback INTEGER DEFAULT 0,
+    scraped_at TEXT,
+    position INTEGER DEFAULT 0,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    UNIQUE (source, title_key, company_key)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location_key);
+
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_id INTEGER NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (job_id, skill)
+);
+CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills (skill);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value REAL
+);
+"""
+
+
+def _fmt(ts):
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else None
+
+
+class JobStore:
+    """
+    SQLite-backed job store shared by every worker process
+
+    Postings are upserted by (source, title, company) and keep first_seen /
+    last_seen times. The live snapshot is what the last full refresh saw
+    (last_seen == refreshed_at): postings missing from a newer scrape stop
+    being served at once and are deleted after `expire_after` seconds.
+    Fallback postings are never stored. The time of the last full refresh
+    and a refresh lease live in the meta table so separate workers can
+    tell whether someone else has already scraped.
+    """
+
+    def __init__(self, path, expire_after=86400):
+        self.path = path
+        self.expire_after = expire_after
+        self.local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self.conn() as conn:
+            conn.executescript(SCHEMA)
+
+    def conn(self):
+        """Connection for the current thread"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA foreign_keys=ON')
+            self.local.conn = conn
+        return conn
+
+    def upsert(self, jobs, refreshed=True):
+        """
+        Insert or update jobs and return how many were written
+
+        With refreshed=True this counts as a full refresh: refreshed_at is
+        updated, so postings this scrape didn't return leave the live
+        snapshot, and expired postings are removed. Fallback jobs are
+        skipped.
+        """
+        now = time.time()
+        jobs = [job for job in jobs if not job.get('is_fallback')]
+        with self.conn() as conn:
+            for pos, job in enumerate(jobs):
+                skills = job.get('required_skills', [])
+                row = conn.execute(
+                    """
+                    INSERT INTO jobs (source, title, company, title_key, company_key, location, location_key,
+                                      description, link, required_skills, is_fallback, scraped_at, position,
+                                      first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (source, title_key, company_key) DO UPDATE SET
+                        location = excluded.location,
+                        location_key = excluded.location_key,
+                        description = excluded.description,
+                        link = excluded.link,
+                        required_skills = excluded.required_skills,
+                        is_fallback = excluded.is_fallback,
+                        scraped_at = excluded.scraped_at,
+                        position = excluded.position,
+                        last_seen = excluded.last_seen
+                    RETURNING id
+                    """,
+                    (
+                        job.get('source', 'unknown'), job['title'], job['company'],
+                        job['title'].lower(), job['company'].lower(),
+                        job.get('location', ''), (job.get('location') or '').lower(),
+                        job.get('description', ''), job.get('link', ''), json.dumps(skills),
+                        int(bool(job.get('is_fallback'))), job.get('scraped_at'), pos, now, now
+                    )
+                ).fetchone()
+                conn.execute('DELETE FROM job_skills WHERE job_id = ?', (row['id'],))
+                conn.executemany(
+                    'INSERT OR IGNORE INTO job_skills (job_id, skill) VALUES (?, ?)',
+                    [(row['id'], s.lower().strip()) for s in skills]
+                )
+            if refreshed:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)", (now,))
+                conn.execute("DELETE FROM meta WHERE key = 'refresh_lease'")
+                self._expire(conn, now)
+        return len(jobs)
+
+    def _expire(self, conn, now):
+        cur = conn.execute('DELETE FROM jobs WHERE last_seen < ?', (now - self.expire_after,))
+        if cur.rowcount:
+            print(f"Expired {cur.rowcount} old jobs from store")
+
+    def _to_job(self, row):
+        return {
+            'title': row['title'],
+            'company': row['company'],
+            'location': row['location'],
+            'description': row['description'],
+            'link': row['link'],
+            'required_skills': json.loads(row['required_skills'] or '[]'),
+            'source': row['source'],
+            'is_fallback': bool(row['is_fallback']),
+            'scraped_at': row['scraped_at'],
+            'first_seen': _fmt(row['first_seen']),
+            'last_seen': _fmt(row['last_seen'])
+        }
+
+    def query(self, location=None, skill=None, limit=None):
+        """
+        Jobs from the last full refresh, in scrape order
+
+        Args:
+            location: Case-insensitive substring of the location
+            skill: Exact (normalized) required skill, served from the skill index
+            limit: Maximum number of jobs
+        """
+        sql = 'SELECT j.* FROM jobs j'
+        args = []
+        where = ["j.last_seen >= (SELECT COALESCE(MAX(value), 0) FROM meta WHERE key = 'refreshed_at')",
+                 'j.is_fallback = 0']
+        if skill:
+            sql += ' JOIN job_skills s ON s.job_id = j.id AND s.skill = ?'
+            args.insert(0, skill.lower().strip())
+        if location:
+            where.append('j.location_key LIKE ?')
+            args.append(f'%{location.lower()}%')
+        sql += ' WHERE ' + ' AND '.join(where) + ' ORDER BY j.position, j.id'
+        if limit:
+            sql += ' LIMIT ?'
+            args.append(int(limit))
+        return [self._to_job(row) for row in self.conn().execute(sql, args)]
+
+    def all_jobs(self):
+        return self.query()
+
+    def count(self):
+        """Stored postings, including ones outside the live snapshot that haven't expired yet"""
+        return self.conn().execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def refreshed_at(self):
+        """Time of the last full refresh by any worker (0 if never)"""
+        row = self.conn().execute("SELECT value FROM meta WHERE key = 'refreshed_at'").fetchone()
+        return row['value'] if row else 0
+
+    def claim_refresh(self, lease=120):
+        """
+        Try to become the worker that scrapes; False if another worker holds
+        an unexpired lease. The lease is released by the next upsert.
+        """
+        now = time.time()
+        with self.conn() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute("SELECT value FROM meta WHERE key = 'refresh_lease'").fetchone()
+            if row and row['value'] > now:
+                return False
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('refresh_lease', ?)", (now + lease,))
+        return True
+
+    def release_refresh(self):
+        with self.conn() as conn:
+            conn.execute("DELETE FROM meta WHERE key = 'refresh_lease'")
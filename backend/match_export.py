@@ -0,0 +1,122 @@
+"""Match Export Module - Columnar (resume, job) match exports for analytics"""
+
+import csv
+import gzip
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+COLUMNS = ['resume_file', 'email', 'phone', 'skills_count', 'status', 'job_rank',
+           'job_title', 'company', 'location', 'match', 'matching_skills', 'link']
+
+PARQUET_SCHEMA = pa.schema([
+    ('resume_file', pa.string()),
+    ('email', pa.string()),
+    ('phone', pa.string()),
+    ('skills_count', pa.int32()),
+    ('status', pa.string()),
+    ('job_rank', pa.int32()),
+    ('job_title', pa.string()),
+    ('company', pa.string()),
+    ('location', pa.string()),
+    ('match', pa.float64()),
+    ('matching_skills', pa.list_(pa.string())),
+    ('link', pa.string()),
+]) if pa else None
+
+
+def available_formats():
+    return ['csv.gz', 'parquet'] if pa else ['csv.gz']
+
+
+def match_rows(parsed, jobs):
+    """
+    Flat rows for one resume: one per matched job
+
+    Resumes that failed to parse or matched nothing still get a single
+    row (status 'error' / 'no_match') so they show up in counts.
+    """
+    base = {
+        'resume_file': parsed.get('filename'),
+        'email': parsed.get('email'),
+        'phone': parsed.get('phone'),
+        'skills_count': len(parsed.get('skills', [])),
+    }
+    if 'error' in parsed or not jobs:
+        yield dict(base, status='error' if 'error' in parsed else 'no_match', job_rank=None, job_title=None,
+                   company=None, location=None, match=None, matching_skills=[], link=None)
+        return
+    for rank, job in enumerate(jobs, start=1):
+        yield dict(base, status='ok', job_rank=rank, job_title=job['title'], company=job['company'],
+                   location=job.get('location'), match=job['match'],
+                   matching_skills=job.get('matching_skills', []), link=job.get('link'))
+
+
+class MatchExportWriter:
+    """
+    Writes (resume, job) match rows incrementally as a bulk run progresses
+
+    CSV rows go straight into a gzip stream; Parquet (when pyarrow is
+    installed) is written one row group per `row_group` rows, so memory
+    stays bounded by a single row group.
+    """
+
+    def __init__(self, out_dir, basename, formats=None, row_group=10000):
+        self.formats = [f for f in (formats or available_formats()) if f in available_formats()]
+        self.paths = {fmt: os.path.join(out_dir, f'{basename}.{fmt}') for fmt in self.formats}
+        self.row_group = row_group
+        self.rows = 0
+
+        self.csv_file = None
+        if 'csv.gz' in self.paths:
+            self.csv_file = gzip.open(self.paths['csv.gz'], 'wt', encoding='utf-8', newline='')
+            self.csv = csv.writer(self.csv_file)
+            self.csv.writerow(COLUMNS)
+
+        self.parquet = None
+        self.pending = []
+        if 'parquet' in self.paths:
+            self.parquet = pq.ParquetWriter(self.paths['parquet'], PARQUET_SCHEMA, compression='snappy')
+
+    def add(self, parsed, jobs):
+        """Append the rows for one processed resume"""
+        for row in match_rows(parsed, jobs):
+            self.rows += 1
+            if self.csv_file:
+                self.csv.writerow([
+                    '; '.join(row[col]) if col == 'matching_skills' else row[col]
+                    for col in COLUMNS
+                ])
+            if self.parquet:
+                self.pending.append(row)
+                if len(self.pending) >= self.row_group:
+                    self._flush_parquet()
+
+    def _flush_parquet(self):
+        if self.pending:
+            self.parquet.write_table(pa.Table.from_pylist(self.pending, schema=PARQUET_SCHEMA))
+            self.pending = []
+
+    def close(self):
+        """Finish every file and return {format: filename}"""
+        if self.csv_file:
+            self.csv_file.close()
+        if self.parquet:
+            self._flush_parquet()
+            self.parquet.close()
+        return {fmt: os.path.basename(path) for fmt, path in self.paths.items()}
+
+    def discard(self):
+        """Close and delete partly written files"""
+        try:
+            self.close()
+        except Exception:
+            pass
+        for path in self.paths.values():
+            if os.path.exists(path):
+                os.remove(path)
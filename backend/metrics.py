@@ -0,0 +1,205 @@
+"""Metrics Module - In-process timers and counters with Prometheus text export"""
+
+import bisect
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+
+NAMESPACE = 'resume_matcher'
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+HELP = {
+    'http_request_seconds': 'Latency of API requests by endpoint',
+    'resume_extract_seconds': 'Text extraction time per resume by file format',
+    'pdf_page_seconds': 'Text extraction time per PDF page',
+    'pdf_truncated_total': 'PDFs cut short by the page or character budget',
+    'contact_extract_seconds': 'Email and phone extraction time per resume',
+    'skill_detect_seconds': 'Skill detection time per resume',
+    'job_match_seconds': 'Job scoring time by matcher',
+    'scrape_source_seconds': 'Time spent fetching one job source',
+    'scrape_jobs_total': 'Jobs returned by each job source',
+    'scrape_late_total': 'Job sources that missed the scrape deadline',
+    'job_cache_requests_total': 'Job cache reads by outcome',
+    'job_cache_refresh_seconds': 'Duration of job cache refreshes',
+    'parse_cache_requests_total': 'Parse cache lookups by outcome',
+    'match_cache_requests_total': 'Scored match list cache lookups by outcome',
+    'report_cache_requests_total': 'Export report cache lookups by outcome',
+    'excel_report_seconds': 'Excel report generation time by report kind',
+    'bulk_files_total': 'Files processed by bulk jobs by outcome',
+    'bulk_parse_failures_total': 'Bulk resume parses that failed by reason',
+    'bulk_pool_restarts_total': 'Parse pools replaced after a worker process died',
+    'candidate_rerank_seconds': 'Time to apply a job feed change to the candidate pool',
+    'candidate_match_seconds': 'Time to rank stored candidates for one posting',
+}
+
+_NOOP = nullcontext()
+
+
+def _label_str(labels, extra=None):
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in items) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Histogram:
+    """Fixed-bucket latency histogram"""
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Estimate a quantile by interpolating inside the bucket that holds it"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+
+class Timer:
+    """Context manager that records its elapsed time into a histogram"""
+
+    __slots__ = ('registry', 'name', 'labels', 'start')
+
+    def __init__(self, registry, name, labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Registry:
+    """
+    Counters and histograms keyed by metric name and label set
+
+    Everything lives in the current process. Bulk jobs parse resumes in
+    worker processes, so their extraction timings are not included; the
+    per-file outcomes are still counted in the parent.
+
+    When disabled, timer() hands back a shared no-op context manager and
+    inc()/observe() return immediately.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self.lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = Histogram()
+            hist.observe(seconds)
+
+    def timer(self, name, **labels):
+        """Time a block: `with metrics.timer('skill_detect_seconds'): ...`"""
+        if not self.enabled:
+            return _NOOP
+        return Timer(self, name, labels)
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        with self.lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted((key, (h.bounds, list(h.counts), h.sum, h.count))
+                                for key, h in self.histograms.items())
+
+        lines = []
+        last = None
+        for (name, labels), value in counters:
+            full = f'{NAMESPACE}_{name}'
+            if name != last:
+                lines.append(f'# HELP {full} {HELP.get(name, name)}')
+                lines.append(f'# TYPE {full} counter')
+                last = name
+            lines.append(f'{full}{_label_str(labels)} {value}')
+
+        for (name, labels), (bounds, counts, total, count) in histograms:
+            full = f'{NAMESPACE}_{name}'
+            if name != last:
+                lines.append(f'# HELP {full} {HELP.get(name, name)}')
+                lines.append(f'# TYPE {full} histogram')
+                last = name
+            cumulative = 0
+            for bound, n in zip(bounds, counts):
+                cumulative += n
+                lines.append(f'{full}_bucket{_label_str(labels, ("le", repr(float(bound))))} {cumulative}')
+            lines.append(f'{full}_bucket{_label_str(labels, ("le", "+Inf"))} {count}')
+            lines.append(f'{full}_sum{_label_str(labels)} {total:.6f}')
+            lines.append(f'{full}_count{_label_str(labels)} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self):
+        """Counters and per-histogram count/mean/p50/p95/p99 in milliseconds"""
+        def ms(value):
+            return round(value * 1000, 3) if value is not None else None
+
+        with self.lock:
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for (name, labels), value in sorted(self.counters.items())]
+            timers = [{
+                'name': name,
+                'labels': dict(labels),
+                'count': h.count,
+                'mean_ms': ms(h.sum / h.count) if h.count else None,
+                'p50_ms': ms(h.quantile(0.5)),
+                'p95_ms': ms(h.quantile(0.95)),
+                'p99_ms': ms(h.quantile(0.99))
+            } for (name, labels), h in sorted(self.histograms.items())]
+        return {'enabled': self.enabled, 'counters': counters, 'timers': timers}
+
+
+registry = Registry(enabled=os.environ.get('METRICS', '1') != '0')
+
+inc = registry.inc
+observe = registry.observe
+timer = registry.timer
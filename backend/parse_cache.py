@@ -0,0 +1,125 @@
+"""Parse Cache Module - Content-addressed on-disk cache of resume parse results"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+
+def file_digest(fpath, chunk_size=1024 * 1024):
+    """SHA-256 of a file's bytes"""
+    h = hashlib.sha256()
+    with open(fpath, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def content_digest(src):
+    """SHA-256 of a resume given as a path, bytes/memoryview or seekable file-like"""
+    if isinstance(src, (str, os.PathLike)):
+        return file_digest(src)
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(src).hexdigest()
+    h = hashlib.sha256()
+    pos = src.tell()
+    for chunk in iter(lambda: src.read(1024 * 1024), b''):
+        h.update(chunk)
+    src.seek(pos)
+    return h.hexdigest()
+
+
+class ParseCache:
+    """
+    Resume parse results keyed by file content
+
+    Entries are JSON files named by the SHA-256 of the resume bytes plus
+    the parser version, so renamed or re-uploaded files hit the cache and
+    a parser change invalidates everything. Reads refresh an entry's mtime
+    and the least recently used entries are evicted once the cache grows
+    past max_bytes.
+
+    The byte count lives in this object, so only one instance should
+    write. Worker processes get a deferred() copy: they read the cache
+    directory directly but queue their writes in `pending` for the parent
+    to put, which keeps max_bytes enforced.
+    """
+
+    def __init__(self, cache_dir, parser_version, max_bytes=256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.parser_version = parser_version
+        self.max_bytes = max_bytes
+        self.pending = None
+        os.makedirs(cache_dir, exist_ok=True)
+        self.size = sum(size for _, _, size in self._entries())
+
+    def _path(self, digest):
+        key = f"{digest}-{self.parser_version}"
+        return os.path.join(self.cache_dir, key[:2], key + '.json')
+
+    def _entries(self):
+        """(path, mtime, size) for every cache entry"""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.json'):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield path, st.st_mtime, st.st_size
+
+    def get(self, digest):
+        """Cached entry for a file digest, or None"""
+        path = self._path(digest)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def deferred(self):
+        """Copy whose puts are queued in .pending instead of written (for worker processes)"""
+        copy = ParseCache.__new__(ParseCache)
+        copy.__dict__.update(self.__dict__)
+        copy.pending = []
+        return copy
+
+    def put(self, digest, entry):
+        """Store an entry, evicting least recently used ones if over budget"""
+        if self.pending is not None:
+            self.pending.append((digest, entry))
+            return
+        path = self._path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+        self.size += os.path.getsize(path)
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def evict(self, target=0.9):
+        """Delete least recently used entries until under target * max_bytes"""
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        self.size = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self.size <= self.max_bytes * target:
+                break
+            try:
+                os.remove(path)
+                self.size -= size
+            except OSError:
+                pass
+
+    def stats(self):
+        entries = list(self._entries())
+        return {
+            'entries': len(entries),
+            'size_bytes': sum(size for _, _, size in entries),
+            'max_bytes': self.max_bytes,
+            'parser_version': self.parser_version
+        }
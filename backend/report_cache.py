@@ -0,0 +1,55 @@
+"""Report Cache Module - Content-addressed in-memory cache of generated reports"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+def payload_digest(payload, fmt):
+    """SHA-256 of an export request's canonical JSON and output format"""
+    raw = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(f"{fmt}:{raw}".encode('utf-8')).hexdigest()
+
+
+class ReportCache:
+    """
+    Generated report bytes keyed by the digest of the request that made them
+
+    Identical export requests get the same bytes back (and the digest
+    doubles as the ETag). Least recently used reports are dropped once the
+    cache holds more than max_bytes; reports over max_item_bytes are never
+    cached.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_item_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """(data, download name) for a digest, or None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, data, fname):
+        if len(data) > self.max_item_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old:
+                self.size -= len(old[0])
+            self.entries[key] = (data, fname)
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, (evicted, _) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'size_bytes': self.size, 'max_bytes': self.max_bytes}
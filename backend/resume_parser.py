@@ -1,88 +1,375 @@
 """Resume Parsing Module - Handles resume extraction and skill detection"""
 
 import PyPDF2
-import docx2txt
 import re
+import json
+import hashlib
+import time
+import io
+import os
+import contextlib
 
+import metrics
+from docx_reader import docx_text
 
-def extract_pdf(fpath):
-    """Extract text from PDF"""
-    txt = ""
+# Bump when text or contact extraction changes to invalidate cached parses
+PARSER_VERSION = '4'
+
+# Extraction budget per PDF so oversized documents can't stall a worker
+PDF_MAX_PAGES = 50
+PDF_MAX_CHARS = 200000
+
+# Contact patterns, compiled once per process
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]')
+LINKEDIN_RE = re.compile(r'(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[A-Za-z0-9_%-]+/?', re.I)
+GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9][A-Za-z0-9-]*/?', re.I)
+NAME_WORD = r"[^\W\d_](?:[^\W\d_]|['.-])*"
+NAME_RE = re.compile(rf"{NAME_WORD}(?: {NAME_WORD}){{1,3}}")
+NAME_LABEL_RE = re.compile(r"(?:full\s+)?name\s*[:-]\s*(.*)", re.I)
+
+# Names are only looked for in the first lines of a resume
+HEADER_CHARS = 600
+HEADER_LINES = 6
+NOT_NAMES = {'resume', 'résumé', 'curriculum', 'vitae', 'cv', 'name', 'full', 'summary', 'profile', 'objective',
+             'contact', 'email', 'phone', 'mobile', 'address', 'professional', 'experience', 'education',
+             'skills', 'technical'}
+# Header lines holding one of these are a job title, not a name
+TITLE_WORDS = {'engineer', 'developer', 'scientist', 'analyst', 'manager', 'senior', 'junior', 'lead',
+               'architect', 'consultant', 'designer', 'programmer', 'administrator', 'specialist',
+               'director', 'intern', 'student', 'officer', 'associate', 'principal', 'staff', 'head',
+               'technician', 'coordinator', 'executive', 'assistant', 'freelance', 'freelancer'}
+
+
+def as_stream(src):
+    """
+    Binary stream for a resume source
+
+    Paths are opened and file-like objects (e.g. an upload's
+    SpooledTemporaryFile) are used as they are. bytes - including a
+    memoryview over a whole bytes object - are wrapped without a copy,
+    since BytesIO shares an immutable initial buffer; bytearray and other
+    memoryviews are copied once.
+    """
+    if isinstance(src, (str, os.PathLike)):
+        return open(src, 'rb')
+    if isinstance(src, memoryview) and isinstance(src.obj, bytes) and src.nbytes == len(src.obj):
+        src = src.obj
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        return io.BytesIO(src)
+    return src
+
+
+def iter_pdf_pages(fpath, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS, stats=None):
+    """
+    Yield the text of each PDF page lazily
+
+    Accepts a path, bytes/memoryview or a binary file-like object.
+
+    Stops after max_pages pages or once max_chars characters have been
+    produced, so huge scanned portfolios can't stall a worker. Page times
+    go to the pdf_page_seconds metric; if a stats dict is given it is
+    also filled with per-page timings and whether the budget cut the
+    document short.
+    """
+    if stats is not None:
+        stats.update({'pages': 0, 'chars': 0, 'page_times': [], 'truncated': False})
+    
+    chars = 0
     try:
-        with open(fpath, 'rb') as f:
+        f = as_stream(fpath)
+        with f if f is not fpath else contextlib.nullcontext(f):
             reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                txt += page.extract_text()
+            for num, page in enumerate(reader.pages):
+                if (max_pages and num >= max_pages) or (max_chars and chars >= max_chars):
+                    metrics.inc('pdf_truncated_total')
+                    if stats is not None:
+                        stats['truncated'] = True
+                    break
+                start = time.perf_counter()
+                page_txt = page.extract_text() or ''
+                elapsed = time.perf_counter() - start
+                metrics.observe('pdf_page_seconds', elapsed)
+                chars += len(page_txt)
+                if stats is not None:
+                    stats['pages'] += 1
+                    stats['chars'] = chars
+                    stats['page_times'].append(round(elapsed, 4))
+                yield page_txt
     except Exception as e:
         print(f"PDF extract error: {e}")
+
+
+def extract_pdf(fpath, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS, stats=None):
+    """Extract text from PDF"""
+    stats = {} if stats is None else stats
+    txt = "".join(iter_pdf_pages(fpath, max_pages, max_chars, stats))
+    if max_chars and len(txt) > max_chars:
+        txt = txt[:max_chars]
+        if not stats['truncated']:
+            metrics.inc('pdf_truncated_total')
+        stats['truncated'] = True
+        stats['chars'] = max_chars
     return txt
 
 
 def extract_docx(fpath):
-    """Extract text from DOCX"""
+    """Extract text from DOCX (path, bytes/memoryview or file-like)"""
     try:
-        return docx2txt.process(fpath)
+        return docx_text(fpath if isinstance(fpath, (str, os.PathLike)) else as_stream(fpath))
     except Exception as e:
         print(f"DOCX extract error: {e}")
         return ""
 
 
 def extract_doc(fpath):
-    """Extract text from DOC"""
+    """Extract text from DOC (path, bytes/memoryview or file-like)"""
     try:
-        return docx2txt.process(fpath)
+        return docx_text(fpath if isinstance(fpath, (str, os.PathLike)) else as_stream(fpath))
     except Exception as e:
         print(f"DOC extract error: {e}")
         return ""
 
 
-def extract_resume(fpath):
-    """Extract text from resume file"""
-    ext = fpath.rsplit('.', 1)[1].lower()
-    if ext == 'pdf':
-        return extract_pdf(fpath)
-    elif ext == 'docx':
-        return extract_docx(fpath)
-    elif ext == 'doc':
-        return extract_doc(fpath)
-    else:
-        return ""
+def extract_resume(fpath, fname=None, stats=None):
+    """
+    Extract text from resume file
+
+    Args:
+        fpath: Path, bytes/memoryview or binary file-like object
+        fname: Original filename, needed for the format when fpath isn't a path
+        stats: Optional dict filled with PDF page stats (see iter_pdf_pages)
+    """
+    name = fname or os.fspath(fpath)
+    ext = name.rsplit('.', 1)[1].lower()
+    with metrics.timer('resume_extract_seconds', format=ext):
+        if ext == 'pdf':
+            return extract_pdf(fpath, stats=stats)
+        elif ext == 'docx':
+            return extract_docx(fpath)
+        elif ext == 'doc':
+            return extract_doc(fpath)
+        else:
+            return ""
 
 
 def extract_email(txt):
-    """Extract email from text"""
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(pattern, txt)
-    return emails[0] if emails else None
+    """Extract email from text (first match; the scan stops there)"""
+    m = EMAIL_RE.search(txt)
+    return m.group() if m else None
 
 
 def extract_phone(txt):
-    """Extract phone number from text"""
-    pattern = r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]'
-    phones = re.findall(pattern, txt)
-    return phones[0] if phones else None
+    """Extract phone number from text (first match; the scan stops there)"""
+    m = PHONE_RE.search(txt)
+    return m.group() if m else None
 
 
-def extract_skills(txt):
-    """Extract skills from resume text"""
-    txt_low = txt.lower()
-    skill_kws = {
-        'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go', 'rust', 'typescript',
-        'vba', 'visual basic', 'r', 'matlab', 'scala', 'perl',
-        'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'asp.net',
-        'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'cassandra', 'dynamodb',
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'ci/cd', 'terraform', 'ansible',
-        'machine learning', 'deep learning', 'data analysis', 'pandas', 'numpy', 'scikit-learn', 
-        'tensorflow', 'pytorch', 'keras', 'statistics', 'data visualization', 'tableau', 'power bi',
-        'android', 'ios', 'react native', 'flutter', 'mobile development',
-        'excel', 'vba', 'macros', 'power query', 'power pivot', 'access', 'word', 'powerpoint',
-        'git', 'agile', 'scrum', 'rest api', 'graphql', 'microservices', 'linux', 'unix',
-        'api', 'rest', 'testing', 'junit', 'selenium'
+def _find_url(txt, low, host, pattern):
+    """First profile URL on a host, searched only around occurrences of the host name"""
+    pos = low.find(host)
+    while pos != -1:
+        m = pattern.search(txt, max(pos - 20, 0), pos + len(host) + 120)
+        if m:
+            return m.group()
+        pos = low.find(host, pos + 1)
+    return None
+
+
+def looks_like_name(line):
+    """Whether a header line reads as a person's name rather than a heading, title or skill list"""
+    words = line.split()
+    if not NAME_RE.fullmatch(line) or not all(w[0].isupper() for w in words):
+        return False
+    lows = [w.lower().strip('.') for w in words]
+    if any(w in NOT_NAMES or w in TITLE_WORDS for w in lows):
+        return False
+    # "Python Developer" or "Machine Learning": mostly skill words
+    skill_words = {w for skill in skill_matcher.find(line) for w in skill.split()}
+    return sum(w in skill_words for w in lows) * 2 <= len(lows)
+
+
+def extract_names(txt):
+    """Name candidates from the header lines, best guess first (labelled names lead)"""
+    labelled, names = [], []
+    after_label = False
+    lines = txt[:HEADER_CHARS].splitlines()
+    for line in [l.strip() for l in lines if l.strip()][:HEADER_LINES]:
+        line = ' '.join(line.split())
+        label = NAME_LABEL_RE.fullmatch(line)
+        if label:
+            value = label.group(1).strip()
+            after_label = not value
+            if value and looks_like_name(value):
+                labelled.append(value)
+            continue
+        if after_label:
+            after_label = False
+            if looks_like_name(line):
+                labelled.append(line)
+            continue
+        if not line.endswith(':') and looks_like_name(line):
+            names.append(line)
+    return labelled + names
+
+
+def extract_contacts(txt):
+    """
+    All contact fields of a resume in one call
+
+    Email and phone use precompiled patterns and stop at their first
+    match, which for almost every resume sits in the header, so only the
+    opening lines are scanned unless a field is missing. LinkedIn/GitHub
+    URLs are located with a plain substring search before the pattern is
+    applied, and names are only looked for in the header.
+
+    Returns:
+        Dict with email, phone, linkedin, github (None when absent) and
+        names (list of candidates)
+    """
+    low = txt.lower()
+    return {
+        'email': extract_email(txt) if '@' in txt else None,
+        'phone': extract_phone(txt),
+        'linkedin': _find_url(txt, low, 'linkedin.com', LINKEDIN_RE),
+        'github': _find_url(txt, low, 'github.com', GITHUB_RE),
+        'names': extract_names(txt)
     }
-    
-    found = []
-    for skill in skill_kws:
-        if skill in txt_low:
-            found.append(skill)
-    
-    return found
+
+
+SKILL_KWS = [
+    'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go', 'rust', 'typescript',
+    'vba', 'visual basic', 'r', 'matlab', 'scala', 'perl',
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring', 'asp.net',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'cassandra', 'dynamodb',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'ci/cd', 'terraform', 'ansible',
+    'machine learning', 'deep learning', 'data analysis', 'pandas', 'numpy', 'scikit-learn',
+    'tensorflow', 'pytorch', 'keras', 'statistics', 'data visualization', 'tableau', 'power bi',
+    'android', 'ios', 'react native', 'flutter', 'mobile development',
+    'excel', 'macros', 'power query', 'power pivot', 'access', 'word', 'powerpoint',
+    'git', 'agile', 'scrum', 'rest api', 'graphql', 'microservices', 'linux', 'unix',
+    'api', 'rest', 'testing', 'junit', 'selenium'
+]
+
+SKILL_SYNONYMS = {
+    'golang': 'go',
+    'nodejs': 'node.js',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'postgres': 'postgresql',
+    'k8s': 'kubernetes',
+    'sklearn': 'scikit-learn',
+    'powerbi': 'power bi',
+    'ms excel': 'excel',
+    'ms access': 'access',
+    'restful api': 'rest api',
+    'google cloud': 'gcp',
+    'amazon web services': 'aws',
+}
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch == '_'
+
+
+def _trie_pattern(node):
+    """Build a regex from a character trie, preferring the longest term"""
+    alts = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not alts:
+        return ''
+    group = alts[0] if len(alts) == 1 and '' not in node else '(?:' + '|'.join(alts) + ')'
+    return group + '?' if '' in node else group
+
+
+class SkillMatcher:
+    """Single-pass skill matcher compiled from a skill dictionary
+
+    All skills and synonyms are folded into one trie-shaped regex with
+    word boundaries, so a resume is scanned once and the cost per character
+    depends on skill length rather than on how large the dictionary grows.
+
+    Skills that are whole words inside a longer skill ('react' in
+    'react native') are reported alongside the longer match.
+    """
+
+    def __init__(self, skills, synonyms=None):
+        self.canon = {}
+        for skill in skills:
+            key = skill.lower().strip()
+            if key:
+                self.canon[key] = key
+        for alias, skill in (synonyms or {}).items():
+            key = alias.lower().strip()
+            if key:
+                self.canon.setdefault(key, skill.lower().strip())
+
+        terms = sorted(self.canon, key=len, reverse=True)
+        trie = {}
+        for term in terms:
+            node = trie
+            for ch in term:
+                node = node.setdefault(ch, {})
+            node[''] = True
+        self.pattern = re.compile(r'(?<!\w)' + _trie_pattern(trie) + r'(?!\w)') if terms else None
+
+        # Skills nested inside a longer term, found once here instead of per resume
+        self.nested = {term: self._nested_terms(term) for term in terms}
+
+        sig = '\n'.join(f"{k}={v}" for k, v in sorted(self.canon.items()))
+        self.version = hashlib.sha1(sig.encode('utf-8')).hexdigest()[:12]
+
+    def _nested_terms(self, term):
+        """Canonical skills that appear as whole words inside a term"""
+        starts = [i for i in range(len(term)) if i == 0 or not _is_word(term[i - 1])]
+        ends = [j for j in range(1, len(term) + 1) if j == len(term) or not _is_word(term[j])]
+        inner = []
+        for i in starts:
+            for j in ends:
+                sub = term[i:j]
+                if j > i and sub != term and sub in self.canon and self.canon[sub] not in inner:
+                    inner.append(self.canon[sub])
+        return inner
+
+    def find(self, txt):
+        """Return canonical skills found in text, in order of first appearance"""
+        if not self.pattern or not txt:
+            return []
+        found = {}
+        for m in self.pattern.finditer(txt.lower()):
+            term = m.group(0)
+            found.setdefault(self.canon[term], None)
+            for skill in self.nested[term]:
+                found.setdefault(skill, None)
+        return list(found)
+
+
+skill_matcher = SkillMatcher(SKILL_KWS, SKILL_SYNONYMS)
+
+
+def set_skill_dictionary(skills, synonyms=None):
+    """Replace the default skill dictionary used by extract_skills"""
+    global skill_matcher
+    skill_matcher = SkillMatcher(skills, synonyms)
+    return skill_matcher
+
+
+def load_skill_dictionary(fpath):
+    """
+    Load a skill dictionary from a JSON file and make it the default
+
+    The file holds either a list of skills or an object with a 'skills'
+    list and an optional 'synonyms' mapping of alias -> skill.
+    """
+    with open(fpath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return set_skill_dictionary(data)
+    return set_skill_dictionary(data.get('skills', []), data.get('synonyms'))
+
+
+def extract_skills(txt, matcher=None):
+    """Extract skills from resume text"""
+    with metrics.timer('skill_detect_seconds'):
+        return (matcher or skill_matcher).find(txt)
@@ -0,0 +1,164 @@
+"""Scrape Transport Module - Pooled HTTP sessions shared by the job scrapers"""
+
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode br responses)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+
+DEFAULT_CONFIG = {
+    'timeout': 10,
+    'retries': 2,
+    'backoff': 0.5,
+    'min_interval': 0.0,
+    'pool_size': 4,
+}
+
+# Longest a Retry-After header may hold a scrape thread, in seconds
+MAX_RETRY_AFTER = 5
+
+# Pages whose validators (and bodies) are kept for revalidation
+VALIDATOR_CACHE_SIZE = 64
+
+# Per-source overrides of DEFAULT_CONFIG
+SOURCE_CONFIG = {
+    'naukri': {'min_interval': 1.0},
+    'instahyre': {'min_interval': 1.0},
+    'remoteok': {'min_interval': 2.0},
+    'indeed': {'min_interval': 2.0, 'retries': 1},
+}
+
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After for at most MAX_RETRY_AFTER seconds"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+class ScrapeTransport:
+    """
+    Shared HTTP transport for scrapers
+
+    Keeps one pooled keep-alive Session per host, retries connection errors
+    and 429/5xx responses with exponential backoff, revalidates pages with
+    ETag / If-Modified-Since and spaces out requests per source.
+
+    URLs are built from client keywords and locations, so only the
+    `max_validators` most recently fetched pages are kept for
+    revalidation.
+    """
+
+    def __init__(self, source_config=None, max_validators=VALIDATOR_CACHE_SIZE):
+        self.source_config = source_config if source_config is not None else SOURCE_CONFIG
+        self.sessions = {}
+        self.validators = OrderedDict()
+        self.max_validators = max_validators
+        self.last_request = {}
+        self.lock = threading.Lock()
+        self.source_locks = {}
+
+    def config(self, source):
+        """Effective settings for a source"""
+        return {**DEFAULT_CONFIG, **self.source_config.get(source, {})}
+
+    def session(self, source, host):
+        """Pooled session for a source's host, created on first use"""
+        key = (source, host)
+        with self.lock:
+            sess = self.sessions.get(key)
+            if sess is None:
+                cfg = self.config(source)
+                retry = CappedRetry(
+                    total=cfg['retries'],
+                    backoff_factor=cfg['backoff'],
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET', 'HEAD']),
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=cfg['pool_size'], max_retries=retry)
+                sess = requests.Session()
+                sess.mount('http://', adapter)
+                sess.mount('https://', adapter)
+                sess.headers['Accept-Encoding'] = ACCEPT_ENCODING
+                self.sessions[key] = sess
+            return sess
+
+    def wait_turn(self, source):
+        """Sleep until the source's min_interval since its last request has passed"""
+        with self.lock:
+            lock = self.source_locks.setdefault(source, threading.Lock())
+        with lock:
+            gap = self.config(source)['min_interval'] - (time.monotonic() - self.last_request.get(source, float('-inf')))
+            if gap > 0:
+                time.sleep(gap)
+            self.last_request[source] = time.monotonic()
+
+    def get(self, source, url, headers=None, timeout=None):
+        """
+        GET a URL for a scraper source
+
+        Sends the stored ETag / Last-Modified validators; a 304 answer
+        returns the previously downloaded response so callers always see a
+        full 200 body.
+        """
+        sess = self.session(source, urlsplit(url).netloc)
+        hdrs = dict(headers or {})
+
+        with self.lock:
+            cached = self.validators.get(url)
+            if cached:
+                self.validators.move_to_end(url)
+        if cached:
+            if cached.headers.get('ETag'):
+                hdrs['If-None-Match'] = cached.headers['ETag']
+            if cached.headers.get('Last-Modified'):
+                hdrs['If-Modified-Since'] = cached.headers['Last-Modified']
+
+        self.wait_turn(source)
+        resp = sess.get(url, headers=hdrs, timeout=timeout or self.config(source)['timeout'])
+
+        if resp.status_code == 304 and cached:
+            print(f"{source}: not modified, reusing cached page")
+            return cached
+
+        if resp.status_code == 200 and (resp.headers.get('ETag') or resp.headers.get('Last-Modified')):
+            resp.content  # read the body now so the cached copy is complete
+            with self.lock:
+                self.validators[url] = resp
+                self.validators.move_to_end(url)
+                while len(self.validators) > self.max_validators:
+                    self.validators.popitem(last=False)
+
+        return resp
+
+    def close(self):
+        with self.lock:
+            for sess in self.sessions.values():
+                sess.close()
+            self.sessions.clear()
+            self.validators.clear()
+
+
+transport = ScrapeTransport()
+atexit.register(transport.close)
+
+
+def http_get(source, url, headers=None, timeout=None):
+    """GET through the shared scrape transport"""
+    return transport.get(source, url, headers=headers, timeout=timeout)
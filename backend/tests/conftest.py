@@ -0,0 +1,38 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Overlapping names so partial (substring) matches are exercised too
+SKILL_POOL = ['python', 'Python ', 'java', 'javascript', 'JavaScript', 'sql', 'mysql', 'sql server',
+              'c', 'c++', 'c#', 'go', 'golang', 'react', 'react native', 'node', 'node.js', 'aws',
+              'docker', 'kubernetes', 'ml', 'machine learning', 'html', 'css', 'excel', 'r', 'rust']
+LOCATIONS = ['Bangalore, India', 'Remote', 'New York, NY', 'Pune, India', '']
+
+
+@pytest.fixture
+def make_jobs():
+    """Factory for random job postings shaped like the scraper's output"""
+    def make(n, seed=0, max_skills=8):
+        rng = random.Random(seed)
+        return [{
+            'title': f'Job {i}',
+            'company': f'Company {i % 7}',
+            'location': rng.choice(LOCATIONS),
+            'description': 'desc',
+            'link': f'https://example.com/{i}',
+            'source': 'test',
+            'required_skills': rng.sample(SKILL_POOL, rng.randint(0, max_skills))
+        } for i in range(n)]
+    return make
+
+
+@pytest.fixture
+def random_skills():
+    """Factory for random resume skill lists"""
+    def make(rng, low=0, high=10):
+        return rng.sample(SKILL_POOL, rng.randint(low, high))
+    return make
@@ -0,0 +1,57 @@
+import pytest
+
+
+@pytest.fixture(scope='module')
+def client(tmp_path_factory):
+    root = tmp_path_factory.mktemp('app')
+    mp = pytest.MonkeyPatch()
+    mp.chdir(root)
+    mp.setenv('JOB_STORE', '')
+    mp.setenv('PARSE_CACHE_DIR', '')
+    mp.setenv('CANDIDATE_POOL', str(root / 'candidates.db'))
+    mp.setenv('MATCH_CANDIDATES_MAX', '3')
+    import app
+    yield app.app.test_client()
+    mp.undo()
+
+
+@pytest.mark.parametrize('params', [
+    {'top_k': 'abc'},
+    {'top_k': [1]},
+    {'top_k': 0},
+    {'top_k': True},
+    {'min_match': None},
+    {'min_match': 'nan'},
+    {'min_match': 150},
+    {'min_match': False},
+    {'required_skills': [1, 2]},
+    {'required_skills': 'python'},
+    {'required_skills': ['python', ' ']},
+    {'required_skills': None, 'job': 'python dev'},
+    {'required_skills': None, 'job': {'required_skills': 'python'}},
+    {'required_skills': None, 'job': {'title': 42}},
+])
+def test_match_candidates_rejects_bad_params(client, params):
+    resp = client.post('/api/match-candidates', json=dict({'required_skills': ['python']}, **params))
+    assert resp.status_code == 400
+    assert 'error' in resp.get_json()
+
+
+def test_match_candidates_rejects_non_object_body(client):
+    resp = client.post('/api/match-candidates', json=['python'])
+    assert resp.status_code == 400
+
+
+def test_match_candidates_caps_top_k(client):
+    import app
+    for c in range(5):
+        app.candidatePool.add({'digest': f'd{c}', 'filename': f'r{c}.pdf', 'skills': ['python', 'sql']}, app.JobIndex([]))
+    resp = client.post('/api/match-candidates', json={'required_skills': ['python'], 'top_k': 10 ** 9})
+    assert resp.status_code == 200
+    assert len(resp.get_json()['candidates']) == 3
+
+
+def test_match_candidates_accepts_job_title(client):
+    resp = client.post('/api/match-candidates', json={'job': {'title': 'Senior Python Developer'}})
+    assert resp.status_code == 200
+    assert 'python' in [s.lower() for s in resp.get_json()['required_skills']]
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from batch_matcher import BatchMatcher
+from job_matcher import calc_match
+
+
+def expected_top(resume_skills, jobs, k, min_match):
+    """(job id, score) in recommend_jobs order: rounded score descending, then job order"""
+    scored = [(jid, calc_match(resume_skills, job['required_skills'])) for jid, job in enumerate(jobs)]
+    hits = [(jid, score) for jid, score in scored if score >= min_match]
+    hits.sort(key=lambda hit: -round(hit[1], 1))
+    return hits[:k]
+
+
+def test_score_matrix_matches_calc_match(make_jobs, random_skills):
+    rng = random.Random(1)
+    jobs = make_jobs(120, seed=1)
+    resumes = [random_skills(rng) for _ in range(40)]
+    matrix = BatchMatcher(jobs, block_size=32).score_matrix(resumes)
+
+    assert matrix.shape == (len(resumes), len(jobs))
+    for rid, skills in enumerate(resumes):
+        for jid, job in enumerate(jobs):
+            assert matrix[rid, jid] == pytest.approx(calc_match(skills, job['required_skills']))
+
+
+@pytest.mark.parametrize('min_match', [0, 5, 10, 50])
+def test_top_k_matches_recommend_jobs_order(make_jobs, random_skills, min_match):
+    rng = random.Random(min_match)
+    for case in range(20):
+        jobs = make_jobs(rng.randint(0, 60), seed=case)
+        resumes = [random_skills(rng) for _ in range(8)]
+        k = rng.choice([1, 5, 20])
+        tops = BatchMatcher(jobs, block_size=16).top_k(resumes, k=k, min_match=min_match)
+        for skills, top in zip(resumes, tops):
+            want = expected_top(skills, jobs, k, min_match)
+            assert [jid for jid, _ in top] == [jid for jid, _ in want]
+            assert [score for _, score in top] == pytest.approx([score for _, score in want])
+
+
+def test_no_jobs():
+    matcher = BatchMatcher([])
+    assert matcher.score_matrix([['python']]).shape == (1, 0)
+    assert matcher.recommend_many([['python'], []]) == [[], []]
@@ -0,0 +1,89 @@
+import random
+import time
+
+import pytest
+
+from candidate_pool import CandidatePool
+from job_matcher import JobIndex, calc_match
+
+
+@pytest.fixture
+def pool(tmp_path):
+    return CandidatePool(str(tmp_path / 'candidates.db'), top_n=5)
+
+
+def add_candidates(pool, jobs, rng, random_skills, n=60):
+    index = JobIndex(jobs)
+    for c in range(n):
+        pool.add({'digest': f'd{c}', 'filename': f'r{c}.pdf', 'skills': random_skills(rng, 1, 10)}, index)
+
+
+def saved(pool, cid):
+    return [(m['job_key'], round(m['score'], 6)) for m in pool.matches(cid)]
+
+
+def test_delta_rerank_matches_full_rescore(pool, make_jobs, random_skills):
+    rng = random.Random(3)
+    jobs = make_jobs(150, seed=3)
+    for i, job in enumerate(jobs):
+        job['title'] = f'Role {i}'
+    pool.apply_feed(jobs)
+    add_candidates(pool, jobs, rng, random_skills)
+
+    for rnd in range(10):
+        jobs = [job for job in jobs if rng.random() > 0.05]
+        for job in rng.sample(jobs, 5):
+            job['required_skills'] = rng.sample(job['required_skills'] + ['python', 'aws', 'go'], 3)
+        new = make_jobs(8, seed=100 + rnd)
+        for i, job in enumerate(new):
+            job['title'] = f'Role {1000 * (rnd + 1) + i}'
+        jobs = jobs + new
+
+        stats = pool.apply_feed(jobs)
+        assert stats['added'] == 8
+        index = JobIndex(jobs)
+        for cid in range(1, pool.count() + 1):
+            want = [(key, round(score, 6)) for key, score in pool.top_matches(index, pool.get(cid)['skills'])]
+            assert saved(pool, cid) == want
+
+
+def test_rescored_postings_keep_added_at(pool):
+    jobs = [
+        {'title': 'Dev', 'company': 'A', 'source': 'x', 'location': 'L', 'required_skills': ['python', 'sql']},
+        {'title': 'Ops', 'company': 'B', 'source': 'x', 'location': 'L', 'required_skills': ['docker']}
+    ]
+    pool.apply_feed(jobs)
+    pool.add({'digest': 'd', 'filename': 'f.pdf', 'skills': ['python', 'sql', 'docker']}, JobIndex(jobs))
+    since = time.time()
+    time.sleep(0.01)
+
+    jobs[0] = dict(jobs[0], required_skills=['python', 'sql', 'java'])
+    stats = pool.apply_feed(jobs)
+    assert stats['changed'] == 1
+    assert stats['new_matches'] == 0
+    assert pool.new_matches(since) == []
+    assert dict(saved(pool, 1))['x|dev|a'] == round(200 / 3, 6)
+
+    jobs.append({'title': 'Data', 'company': 'C', 'source': 'x', 'location': 'L', 'required_skills': ['sql']})
+    stats = pool.apply_feed(jobs)
+    assert stats['new_matches'] == 1
+    assert [m['job_key'] for m in pool.new_matches(since)] == ['x|data|c']
+
+
+def test_match_job_matches_linear_scan(pool, random_skills):
+    rng = random.Random(5)
+    index = JobIndex([])
+    skills = {}
+    for c in range(300):
+        cid = pool.add({'digest': f'd{c}', 'filename': f'r{c}.pdf', 'skills': random_skills(rng, 1, 10)}, index)
+        skills[cid] = pool.get(cid)['skills']
+
+    for _ in range(50):
+        job_skills = random_skills(rng, 1, 6)
+        top_k = rng.choice([1, 5, 15])
+        min_match = rng.choice([0.01, 10, 50])
+        scored = [(cid, calc_match(sk, job_skills)) for cid, sk in skills.items()]
+        want = sorted((hit for hit in scored if hit[1] >= min_match), key=lambda hit: (-round(hit[1], 1), hit[0]))
+        got = pool.match_job(job_skills, top_k=top_k, min_match=min_match)
+        assert [(cand['id'], score) for cand, score, _ in got] == \
+            [(cid, pytest.approx(score)) for cid, score in want[:top_k]]
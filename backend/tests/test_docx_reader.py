@@ -0,0 +1,22 @@
+import glob
+import io
+import os
+
+import pytest
+
+from docx_reader import docx_text
+
+docx2txt = pytest.importorskip('docx2txt')
+
+DATASETS = sorted(glob.glob(os.path.join(os.path.dirname(__file__), '..', '..', 'Datasets', '*.docx')))
+
+
+@pytest.mark.skipif(not DATASETS, reason='sample resumes not present')
+@pytest.mark.parametrize('fpath', DATASETS, ids=os.path.basename)
+def test_matches_docx2txt(fpath):
+    # A parity break changes parse results, so it also needs a PARSER_VERSION bump
+    expected = docx2txt.process(fpath)
+    assert docx_text(fpath) == expected
+    with open(fpath, 'rb') as f:
+        data = f.read()
+    assert docx_text(io.BytesIO(data)) == expected
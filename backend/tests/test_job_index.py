@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from job_matcher import JobIndex, calc_match, norm_skill
+
+
+def test_scores_match_calc_match(make_jobs, random_skills):
+    rng = random.Random(11)
+    for case in range(40):
+        jobs = make_jobs(rng.randint(0, 60), seed=case, max_skills=rng.choice([3, 10, 25]))
+        # Repeated job skills count towards the job's skill total
+        for job in rng.sample(jobs, len(jobs) // 5):
+            job['required_skills'] += job['required_skills'][:2]
+        index = JobIndex(jobs)
+        for _ in range(10):
+            resume = random_skills(rng, 0, 12) + rng.choice([[], ['PYTHON'], ['sql', 'sql'], ['kotlin']])
+            scores = index.score_all(resume)
+            for jid, job in enumerate(jobs):
+                assert scores.get(jid, 0) == pytest.approx(calc_match(resume, job['required_skills']))
+
+
+def test_filter_matches_substring_rules(make_jobs):
+    jobs = make_jobs(80, seed=4)
+    index = JobIndex(jobs)
+    for loc_filter, skill_filter in [('india', None), (None, ['SQL']), ('remote', ['java', 'go']), (None, ['kotlin'])]:
+        passes = index.make_filter(loc_filter, skill_filter)
+        for jid, job in enumerate(jobs):
+            want = True
+            if loc_filter and loc_filter not in job['location'].lower():
+                want = False
+            if skill_filter:
+                wanted = [norm_skill(s) for s in skill_filter]
+                if not any(sf in js or js in sf for sf in wanted for js in map(norm_skill, job['required_skills'])):
+                    want = False
+            assert passes(jid) is want
+    assert index.make_filter() is None
+
+
+def test_each_index_has_its_own_dense_vocabulary():
+    old = JobIndex([{'required_skills': ['cobol', 'fortran', 'Python']}])
+    new = JobIndex([{'required_skills': ['python', 'rust']}])
+
+    assert old.vocab is not new.vocab
+    assert sorted(new.vocab.names) == ['python', 'rust']
+    assert len(old.vocab) == 3
+    assert max(new.job_bits).bit_length() <= len(new.vocab)
+    assert new.score_all(['Python', 'cobol']) == {0: 50.0}
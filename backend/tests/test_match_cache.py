@@ -0,0 +1,37 @@
+from job_matcher import JobIndex, MatchCache
+
+
+def test_hit_for_same_skills_in_any_case(make_jobs):
+    index = JobIndex(make_jobs(20))
+    cache = MatchCache()
+    first = cache.rank(index, ['Python', 'SQL'], generation=1)
+    assert cache.rank(index, [' python', 'sql '], generation=1) is first
+    assert cache.rank(index, ['sql', 'python'], generation=1) is not first
+
+
+def test_new_generation_or_index_misses(make_jobs):
+    jobs = make_jobs(20)
+    index = JobIndex(jobs)
+    cache = MatchCache()
+    first = cache.rank(index, ['python'], generation=1)
+    assert cache.rank(index, ['python'], generation=2) is not first
+
+    rebuilt = JobIndex(jobs)
+    again = cache.rank(rebuilt, ['python'], generation=1)
+    assert again is not first
+    assert again.index is rebuilt
+
+
+def test_expired_and_evicted_entries_are_rescored(make_jobs):
+    index = JobIndex(make_jobs(20))
+    expired = MatchCache(ttl=-1)
+    first = expired.rank(index, ['python'])
+    assert expired.rank(index, ['python']) is not first
+
+    small = MatchCache(maxsize=2)
+    kept = small.rank(index, ['python'])
+    small.rank(index, ['sql'])
+    small.rank(index, ['python'])
+    small.rank(index, ['docker'])
+    assert len(small) == 2
+    assert small.rank(index, ['python']) is kept
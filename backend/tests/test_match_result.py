@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from job_matcher import JobIndex, calc_match, recommend_jobs
+
+
+def original_recommend_jobs(resume_skills, jobs_db, top_n=10, min_match=10, loc_filter=None, skill_filter=None):
+    """recommend_jobs as it was before JobIndex/MatchResult (logging removed)"""
+    matches = []
+    for job in jobs_db:
+        score = calc_match(resume_skills, job['required_skills'])
+        job_low = [s.lower().strip() for s in job['required_skills']]
+        matching = []
+        for rs in resume_skills:
+            for js in job['required_skills']:
+                if rs.lower() == js.lower() or rs.lower() in js.lower() or js.lower() in rs.lower():
+                    if js not in matching:
+                        matching.append(js)
+        if loc_filter and loc_filter.lower() not in job.get('location', '').lower():
+            continue
+        if skill_filter:
+            filter_low = [s.lower().strip() for s in skill_filter]
+            if not any(any(sf in js or js in sf for js in job_low) for sf in filter_low):
+                continue
+        if score >= min_match:
+            matches.append({
+                'title': job['title'],
+                'company': job['company'],
+                'location': job.get('location', 'Not specified'),
+                'description': job['description'],
+                'match': round(score, 1),
+                'matching_skills': matching,
+                'link': job.get('link', ''),
+                'required_skills': job['required_skills']
+            })
+    matches.sort(key=lambda x: x['match'], reverse=True)
+    return matches[:top_n]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_top_matches_original_recommend_jobs(make_jobs, random_skills, seed):
+    rng = random.Random(seed)
+    for case in range(60):
+        jobs = make_jobs(rng.randint(0, 50), seed=seed * 1000 + case, max_skills=rng.choice([3, 8, 20]))
+        result = JobIndex(jobs).rank(random_skills(rng, 0, 12))
+        for _ in range(4):
+            kw = dict(top_n=rng.choice([0, 1, 5, 20, 100]),
+                      min_match=rng.choice([-1, 0, 0.01, 5, 10, 50, 100]),
+                      loc_filter=rng.choice([None, 'india', 'Remote', 'nowhere']),
+                      skill_filter=rng.choice([None, ['python'], ['SQL', 'java'], ['rust']]))
+            assert result.top(**kw) == original_recommend_jobs(result.resume_skills, jobs, **kw)
+
+
+def test_recommend_jobs_accepts_list_or_index(make_jobs):
+    jobs = make_jobs(30, seed=7)
+    skills = ['python', 'sql', 'docker']
+    want = original_recommend_jobs(skills, jobs, top_n=10, min_match=0)
+    assert recommend_jobs(skills, jobs, top_n=10, min_match=0) == want
+    assert recommend_jobs(skills, JobIndex(jobs), top_n=10, min_match=0) == want
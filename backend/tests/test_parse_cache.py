@@ -0,0 +1,94 @@
+import io
+import pickle
+import zipfile
+
+import bulk_pipeline
+from bulk_pipeline import parse_resume
+from parse_cache import ParseCache, content_digest
+from resume_parser import PARSER_VERSION
+
+
+def make_docx(lines):
+    """Smallest DOCX the reader accepts: one paragraph per line"""
+    body = ''.join(f'<w:p><w:r><w:t>{line}</w:t></w:r></w:p>' for line in lines)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as z:
+        z.writestr('word/document.xml',
+                   '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                   f'<w:body>{body}</w:body></w:document>')
+    return buf.getvalue()
+
+
+RESUME = make_docx(['Jane Doe', 'jane@example.com', '+1 555 123 4567', 'Skills: Python, SQL, Docker'])
+
+
+def test_entries_are_keyed_by_parser_version(tmp_path):
+    digest = content_digest(RESUME)
+    old = ParseCache(str(tmp_path), '1')
+    old.put(digest, {'skills': ['python']})
+    assert old.get(digest) == {'skills': ['python']}
+
+    assert ParseCache(str(tmp_path), '2').get(digest) is None
+    assert ParseCache(str(tmp_path), '1').get(digest) == {'skills': ['python']}
+
+
+def test_parse_resume_hits_cache_until_version_changes(tmp_path, monkeypatch):
+    cache = ParseCache(str(tmp_path), PARSER_VERSION)
+    first = parse_resume(RESUME, 'jane.docx', cache)
+    assert first['cached'] is False
+    assert first['name'] == 'Jane Doe'
+    assert first['email'] == 'jane@example.com'
+
+    # A hit must not extract the file again
+    def fail(*args, **kwargs):
+        raise AssertionError('extracted a cached resume')
+    with monkeypatch.context() as m:
+        m.setattr(bulk_pipeline, 'extract_resume', fail)
+        again = parse_resume(io.BytesIO(RESUME), 'renamed.docx', cache)
+    assert again['cached'] is True
+    assert again['filename'] == 'renamed.docx'
+    assert {k: again[k] for k in ('email', 'phone', 'name', 'skills', 'digest')} == \
+        {k: first[k] for k in ('email', 'phone', 'name', 'skills', 'digest')}
+
+    bumped = ParseCache(str(tmp_path), PARSER_VERSION + '-next')
+    assert parse_resume(RESUME, 'jane.docx', bumped)['cached'] is False
+
+
+def test_eviction_keeps_cache_under_budget(tmp_path):
+    cache = ParseCache(str(tmp_path), '1', max_bytes=4096)
+    for i in range(100):
+        cache.put(f'{i:064x}', {'text': 'x' * 200})
+    assert cache.stats()['size_bytes'] <= 4096
+    assert cache.get(f'{99:064x}') is not None
+
+
+def cache_bytes(path):
+    return sum(f.stat().st_size for f in path.rglob('*.json'))
+
+
+def test_worker_copies_hand_writes_to_parent(tmp_path):
+    cache = ParseCache(str(tmp_path), '1', max_bytes=20000)
+    for i in range(200):
+        # Each pool task receives its own pickled copy of the worker cache
+        worker = pickle.loads(pickle.dumps(cache.deferred()))
+        assert worker.get(f'{i:064x}') is None
+        worker.put(f'{i:064x}', {'text': 'x' * 1000})
+        assert cache_bytes(tmp_path) <= 20000
+        for digest, entry in worker.pending:
+            cache.put(digest, entry)
+    assert cache_bytes(tmp_path) <= 20000
+    assert pickle.loads(pickle.dumps(cache.deferred())).get(f'{199:064x}') == {'text': 'x' * 1000}
+
+
+def test_bulk_parse_stays_under_budget(tmp_path):
+    files = []
+    for i in range(30):
+        path = tmp_path / f'r{i}.docx'
+        path.write_bytes(make_docx([f'Person Number{i}', f'p{i}@example.com', 'Skills: Python ' + 'x' * 500]))
+        files.append(str(path))
+    cache = ParseCache(str(tmp_path / 'cache'), PARSER_VERSION, max_bytes=8000)
+
+    results = [r for _, r in bulk_pipeline.iter_parsed(files, workers=2, timeout=30, cache=cache)]
+    assert [r['email'] for r in results] == [f'p{i}@example.com' for i in range(30)]
+    assert cache_bytes(tmp_path / 'cache') <= 8000
+    assert cache.size == cache_bytes(tmp_path / 'cache')
@@ -0,0 +1,42 @@
+import pytest
+
+from resume_parser import extract_contacts, extract_names
+
+
+@pytest.mark.parametrize('txt, name', [
+    ('Jane Doe\njane@example.com', 'Jane Doe'),
+    ('José Álvarez\nSoftware Engineer', 'José Álvarez'),
+    ('Senior Data Scientist\nJane Doe', 'Jane Doe'),
+    ('Python Developer\nAnna Lee', 'Anna Lee'),
+    ('Name: Anna Lee', 'Anna Lee'),
+    ('Full Name:\nAnna Lee\nPython Developer', 'Anna Lee'),
+    ('RESUME\nJOHN SMITH', 'JOHN SMITH'),
+    ("Résumé\nMary O'Neil-Smith", "Mary O'Neil-Smith"),
+    ('Ruby Chen\nruby@example.com', 'Ruby Chen'),
+])
+def test_names(txt, name):
+    assert extract_names(txt)[0] == name
+
+
+@pytest.mark.parametrize('txt', [
+    'Software Engineer\nSkills: Python',
+    'Machine Learning\nReact Native',
+    'Education:\nMIT',
+    'Curriculum Vitae',
+    'jane.doe@example.com\n+1 555 123 4567',
+])
+def test_no_name(txt):
+    assert extract_names(txt) == []
+    assert extract_contacts(txt)['names'] == []
+
+
+def test_contacts():
+    txt = ('Jane Doe\njane.doe@example.com | +1 (555) 123-4567\n'
+           'linkedin.com/in/janedoe  github.com/janedoe\nSkills: Python')
+    assert extract_contacts(txt) == {
+        'email': 'jane.doe@example.com',
+        'phone': '+1 (555) 123-4567',
+        'linkedin': 'linkedin.com/in/janedoe',
+        'github': 'github.com/janedoe',
+        'names': ['Jane Doe']
+    }
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+import resume_parser
+from resume_parser import SkillMatcher, extract_skills, load_skill_dictionary, set_skill_dictionary
+
+
+@pytest.fixture
+def restore_dictionary(monkeypatch):
+    """Put the default skill dictionary back after a test replaces it"""
+    monkeypatch.setattr(resume_parser, 'skill_matcher', resume_parser.skill_matcher)
+
+
+@pytest.mark.parametrize('txt, skills', [
+    ('Good communication, strong drive, great ego', []),
+    ('Worked in R and Go', ['r', 'go']),
+    ('JavaScript, not Java', ['javascript', 'java']),
+    ('mysql database', ['mysql']),
+    ('C++ and C# developer', ['c++', 'c#']),
+    ('Python, python and PYTHON', ['python']),
+    ('', []),
+])
+def test_whole_word_matches(txt, skills):
+    assert extract_skills(txt) == skills
+
+
+@pytest.mark.parametrize('txt, skills', [
+    ('golang, k8s and sklearn', ['go', 'kubernetes', 'scikit-learn']),
+    ('ReactJS and Vue.js', ['react', 'vue']),
+    ('Postgres and Go', ['postgresql', 'go']),
+])
+def test_synonyms_map_to_canonical_skills(txt, skills):
+    assert extract_skills(txt) == skills
+
+
+def test_nested_skills_reported_with_longer_term():
+    assert extract_skills('Built React Native apps') == ['react native', 'react']
+    assert extract_skills('Machine learning with Python') == ['machine learning', 'python']
+
+
+def test_custom_matcher():
+    matcher = SkillMatcher(['Spark', 'spark streaming', 'AI'], {'pyspark': 'spark'})
+    assert matcher.find('PySpark and Spark Streaming, no AIR') == ['spark', 'spark streaming']
+    assert extract_skills('spark streaming', matcher) == ['spark streaming', 'spark']
+    assert SkillMatcher([]).find('python') == []
+
+
+def test_version_tracks_dictionary_contents():
+    a = SkillMatcher(['python', 'sql'], {'py': 'python'})
+    assert a.version == SkillMatcher(['SQL', 'python '], {'py': 'python'}).version
+    assert a.version != SkillMatcher(['python', 'sql']).version
+
+
+def test_set_skill_dictionary(restore_dictionary):
+    set_skill_dictionary(['cobol'], {'cobol85': 'cobol'})
+    assert extract_skills('COBOL85 and Python') == ['cobol']
+
+
+@pytest.mark.parametrize('data', [
+    ['cobol', 'fortran'],
+    {'skills': ['cobol', 'fortran'], 'synonyms': {'f90': 'fortran'}},
+])
+def test_load_skill_dictionary(tmp_path, restore_dictionary, data):
+    path = tmp_path / 'skills.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+    matcher = load_skill_dictionary(str(path))
+    assert resume_parser.skill_matcher is matcher
+    want = ['fortran', 'cobol'] if isinstance(data, dict) else ['cobol']
+    assert extract_skills('F90 and Cobol, Python') == want
@@ -3,12 +3,30 @@
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
 from datetime import datetime
+import csv
+import io
+import re
 import os
+import xlsxwriter
 
 
-def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder):
+def solid_fill(color):
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+# Shared styles, created once instead of per cell
+HDR_FILL = solid_fill("2E7D32")
+MATCH_FILLS = [(70, solid_fill("C8E6C9")), (50, solid_fill("FFF9C4")), (30, solid_fill("FFCCBC"))]
+VBA_TITLE_FILL = solid_fill("1565C0")
+VBA_SECTION_FILL = solid_fill("1976D2")
+
+BULK_HDRS = ['#', 'Filename', 'Email', 'Phone', 'Skills', 'Jobs Found', 'Avg Match %', 'Top Match %', 'Status']
+BULK_WIDTHS = [5, 30, 25, 15, 10, 12, 12, 12, 10]
+
+
+def build_vba_workbook(filename, email, phone, skills, jobs):
     """
-    Generate Excel report with VBA automation tools sheet
+    Build the Excel report with VBA automation tools sheet in memory
     
     Args:
         filename: Resume filename
@@ -16,10 +34,9 @@ def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder)
         phone: Extracted phone
         skills: List of detected skills
         jobs: List of matched jobs
-        upload_folder: Path to save Excel file
     
     Returns:
-        dict with success status and file info
+        (openpyxl Workbook, vba_features dict)
     """
     
     wb = Workbook()
@@ -27,7 +44,7 @@ def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder)
     ws_summary.title = "Dashboard"
     
     # Header styling
-    hdr_fill = PatternFill(start_color="2E7D32", end_color="2E7D32", fill_type="solid")
+    hdr_fill = HDR_FILL
     hdr_font = Font(bold=True, color="FFFFFF", size=14)
     
     # Dashboard Sheet
@@ -119,12 +136,10 @@ def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder)
         ws_jobs.cell(row=idx, column=4, value=job.get('location', 'N/A'))
         
         match_cell = ws_jobs.cell(row=idx, column=5, value=job['match'])
-        if job['match'] >= 70:
-            match_cell.fill = PatternFill(start_color="C8E6C9", end_color="C8E6C9", fill_type="solid")
-        elif job['match'] >= 50:
-            match_cell.fill = PatternFill(start_color="FFF9C4", end_color="FFF9C4", fill_type="solid")
-        elif job['match'] >= 30:
-            match_cell.fill = PatternFill(start_color="FFCCBC", end_color="FFCCBC", fill_type="solid")
+        for threshold, fill in MATCH_FILLS:
+            if job['match'] >= threshold:
+                match_cell.fill = fill
+                break
         
         ws_jobs.cell(row=idx, column=6, value=', '.join(job.get('matching_skills', [])))
         ws_jobs.cell(row=idx, column=7, value=job.get('link', ''))
@@ -168,12 +183,12 @@ def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder)
     ws_vba = wb.create_sheet("VBA Automation Tools")
     ws_vba['A1'] = "VBA AUTOMATION TOOLS & MACROS"
     ws_vba['A1'].font = Font(bold=True, size=14, color="FFFFFF")
-    ws_vba['A1'].fill = PatternFill(start_color="1565C0", end_color="1565C0", fill_type="solid")
+    ws_vba['A1'].fill = VBA_TITLE_FILL
     ws_vba.merge_cells('A1:C1')
     
     ws_vba['A3'] = "Available Macros"
     ws_vba['A3'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws_vba['A3'].fill = PatternFill(start_color="1976D2", end_color="1976D2", fill_type="solid")
+    ws_vba['A3'].fill = VBA_SECTION_FILL
     ws_vba.merge_cells('A3:C3')
     
     vba_macros = [
@@ -201,7 +216,7 @@ def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder)
     
     ws_vba['A16'] = "Quick Actions"
     ws_vba['A16'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws_vba['A16'].fill = PatternFill(start_color="1976D2", end_color="1976D2", fill_type="solid")
+    ws_vba['A16'].fill = VBA_SECTION_FILL
     ws_vba.merge_cells('A16:C16')
     
     quick_actions = [
@@ -220,7 +235,7 @@ def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder)
     
     ws_vba['A24'] = "Data Analysis Features"
     ws_vba['A24'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws_vba['A24'].fill = PatternFill(start_color="1976D2", end_color="1976D2", fill_type="solid")
+    ws_vba['A24'].fill = VBA_SECTION_FILL
     ws_vba.merge_cells('A24:C24')
     
     features = [
@@ -237,8 +252,36 @@ def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder)
         ws_vba[f'A{row}'] = f"• {feature}"
         row += 1
     
+    return wb, {
+        'macros_included': len(vba_macros),
+        'quick_actions': len(quick_actions),
+        'analysis_features': len(features)
+    }
+
+
+def report_filename(filename, ext='xlsx'):
+    """
+    Download name for a single-resume report
+
+    The resume name comes from the client, so everything except letters,
+    digits, '-' and '_' is replaced; the result is safe as a path and in
+    a header.
+    """
+    stem = re.sub(r'[^\w-]+', '_', filename or 'resume').strip('_') or 'resume'
+    return f"job_matches_{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
+
+
+def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder):
+    """
+    Generate Excel report with VBA automation tools sheet and save it to upload_folder
+    
+    Returns:
+        dict with success status and file info
+    """
+    wb, vba_features = build_vba_workbook(filename, email, phone, skills, jobs)
+    
     # Save file
-    export_fname = f"job_matches_{filename.replace('.', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    export_fname = report_filename(filename)
     export_path = os.path.join(upload_folder, export_fname)
     wb.save(export_path)
     
@@ -247,9 +290,88 @@ def create_vba_excel_report(filename, email, phone, skills, jobs, upload_folder)
         'filename': export_fname,
         'filepath': export_path,
         'relative_path': f'backend/uploads/{export_fname}',
-        'vba_features': {
-            'macros_included': len(vba_macros),
-            'quick_actions': len(quick_actions),
-            'analysis_features': len(features)
-        }
+        'vba_features': vba_features
     }
+
+
+def write_vba_report(out, filename, email, phone, skills, jobs):
+    """Write the single-resume XLSX report to a binary file-like object"""
+    wb, _ = build_vba_workbook(filename, email, phone, skills, jobs)
+    wb.save(out)
+
+
+JOB_CSV_HDRS = ['#', 'Job Title', 'Company', 'Location', 'Match %', 'Matching Skills', 'Link']
+
+
+def iter_jobs_csv(jobs):
+    """Job matches as CSV text, one chunk per row"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(JOB_CSV_HDRS)
+    for idx, job in enumerate(jobs, start=1):
+        writer.writerow([
+            idx,
+            job['title'],
+            job['company'],
+            job.get('location', 'N/A'),
+            job['match'],
+            ', '.join(job.get('matching_skills', [])),
+            job.get('link', '')
+        ])
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
+
+
+class BulkReportWriter:
+    """
+    Bulk processing summary written one row at a time
+
+    Uses xlsxwriter's constant_memory mode, so each row is flushed to a
+    temp file as soon as the next one starts and memory stays flat no
+    matter how many resumes are in the batch. Rows must be added in order.
+    """
+    
+    def __init__(self, upload_folder, fname=None):
+        self.fname = fname or f"bulk_processing_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        self.fpath = os.path.join(upload_folder, self.fname)
+        self.rows = 0
+        
+        self.wb = xlsxwriter.Workbook(self.fpath, {'constant_memory': True})
+        self.ws = self.wb.add_worksheet("Bulk Processing Results")
+        hdr_fmt = self.wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'font_size': 12, 'bg_color': '#2E7D32'})
+        
+        for col, width in enumerate(BULK_WIDTHS):
+            self.ws.set_column(col, col, width)
+        self.ws.write_row(0, 0, BULK_HDRS, hdr_fmt)
+    
+    def add(self, result):
+        """Append one per-resume result row"""
+        self.rows += 1
+        self.ws.write_row(self.rows, 0, [
+            self.rows,
+            result['filename'],
+            result.get('email', 'N/A'),
+            result.get('phone', 'N/A'),
+            result.get('skills_count', 0),
+            result.get('jobs_found', 0),
+            result.get('avg_match', 0),
+            result.get('top_match', 0),
+            'Error' if 'error' in result else 'Success'
+        ])
+    
+    def close(self):
+        """Finish the workbook and return its filename"""
+        self.wb.close()
+        return self.fname
+    
+    def discard(self):
+        """Abandon a partly written report"""
+        try:
+            self.wb.close()
+        except Exception:
+            pass
+        if os.path.exists(self.fpath):
+            os.remove(self.fpath)
@@ -0,0 +1,75 @@
+"""DOCX extraction benchmark - native zipfile/expat reader vs docx2txt
+
+Usage:
+    python benchmarks/bench_docx.py [--repeat N] [--out results.json]
+
+Runs both extractors over Datasets/*.docx, checks that they return the
+same text and prints per-file timings as JSON.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'backend'))
+
+import docx2txt  # noqa: E402
+from docx_reader import docx_text  # noqa: E402
+
+
+def best_of(fn, arg, repeat):
+    """Fastest of `repeat` runs in seconds, plus the last result"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(files, repeat=20):
+    rows = []
+    for fpath in files:
+        native_s, native_txt = best_of(docx_text, fpath, repeat)
+        d2t_s, d2t_txt = best_of(docx2txt.process, fpath, repeat)
+        rows.append({
+            'file': os.path.basename(fpath),
+            'chars': len(native_txt),
+            'native_ms': round(native_s * 1000, 3),
+            'docx2txt_ms': round(d2t_s * 1000, 3),
+            'speedup': round(d2t_s / native_s, 2) if native_s else None,
+            'identical': native_txt == d2t_txt
+        })
+    total_native = sum(r['native_ms'] for r in rows)
+    total_d2t = sum(r['docx2txt_ms'] for r in rows)
+    return {
+        'benchmark': 'docx_extract',
+        'repeat': repeat,
+        'files': rows,
+        'total_native_ms': round(total_native, 3),
+        'total_docx2txt_ms': round(total_d2t, 3),
+        'speedup': round(total_d2t / total_native, 2) if total_native else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--out', help='write JSON results to this file')
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(ROOT, 'Datasets', '*.docx')))
+    result = run(files, args.repeat)
+    print(json.dumps(result, indent=2))
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
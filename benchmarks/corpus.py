@@ -0,0 +1,181 @@
+"""Synthetic corpus generator for the parse-and-match benchmarks
+
+Usage:
+    python benchmarks/corpus.py --resumes 10000 --jobs 50000 --files 20 --out corpus/
+
+Resume texts are built from the sample resumes in Datasets/*.docx (their
+lines are reshuffled and given fresh contact details and skills) and job
+feeds are scaled up from get_fallback_jobs(). Everything is seeded, so the
+same arguments always produce the same corpus.
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+import zipfile
+from xml.sax.saxutils import escape
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'backend'))
+
+from docx_reader import docx_text  # noqa: E402
+from job_scraper import get_fallback_jobs  # noqa: E402
+from resume_parser import SKILL_KWS  # noqa: E402
+
+
+LOCATIONS = ['Bangalore, India', 'Hyderabad, India', 'Pune, India', 'Mumbai, India', 'Chennai, India',
+             'Noida, India', 'Gurgaon, India', 'Remote', 'New York, USA', 'London, UK']
+LEVELS = ['', 'Senior ', 'Junior ', 'Lead ', 'Principal ', 'Associate ']
+
+
+def seed_texts():
+    """Text of every sample resume in Datasets/"""
+    return [docx_text(f) for f in sorted(glob.glob(os.path.join(ROOT, 'Datasets', '*.docx')))]
+
+
+def skill_vocab():
+    """Skills used for synthetic postings: fallback job skills plus the resume dictionary"""
+    vocab = []
+    for job in get_fallback_jobs():
+        vocab.extend(job['required_skills'])
+    vocab.extend(SKILL_KWS)
+    return sorted(set(vocab))
+
+
+def generate_resumes(n, seed=0):
+    """n synthetic resume texts derived from the Datasets samples"""
+    rng = random.Random(seed)
+    seeds = [[line for line in txt.splitlines() if line.strip()] for txt in seed_texts()]
+    texts = []
+    for i in range(n):
+        lines = list(rng.choice(seeds))
+        head, body = lines[:3], lines[3:]
+        rng.shuffle(body)
+        body = body[:rng.randint(max(len(body) // 2, 1), max(len(body), 1))]
+        skills = rng.sample(SKILL_KWS, rng.randint(3, 15))
+        texts.append('\n'.join(
+            head
+            + [f'candidate{i}@example.com', f'+91 {rng.randint(70000, 99999)} {rng.randint(10000, 99999)}']
+            + ['Skills: ' + ', '.join(skills)]
+            + body
+        ))
+    return texts
+
+
+def generate_jobs(m, seed=0):
+    """m synthetic job postings scaled up from get_fallback_jobs()"""
+    rng = random.Random(seed)
+    templates = get_fallback_jobs()
+    vocab = skill_vocab()
+    jobs = []
+    for i in range(m):
+        base = templates[i % len(templates)]
+        skills = list(base['required_skills'])
+        rng.shuffle(skills)
+        skills = skills[:rng.randint(2, len(skills))] + rng.sample(vocab, rng.randint(0, 4))
+        title = rng.choice(LEVELS) + base['title']
+        jobs.append({
+            'title': title,
+            'company': f"{base['company']} {i // len(templates)}",
+            'location': rng.choice(LOCATIONS),
+            'description': f"{title} at {base['company']}",
+            'required_skills': list(dict.fromkeys(skills)),
+            'link': base['link'],
+            'source': 'synthetic'
+        })
+    return jobs
+
+
+def write_docx(text, fpath):
+    """Write text as a minimal single-section .docx"""
+    paras = ''.join(f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+                    for line in text.splitlines())
+    doc = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+           '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+           f'<w:body>{paras}</w:body></w:document>')
+    with zipfile.ZipFile(fpath, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('[Content_Types].xml',
+                   '<?xml version="1.0" encoding="UTF-8"?>'
+                   '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                   '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                   '<Default Extension="xml" ContentType="application/xml"/>'
+                   '<Override PartName="/word/document.xml" '
+                   'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                   '</Types>')
+        z.writestr('_rels/.rels',
+                   '<?xml version="1.0" encoding="UTF-8"?>'
+                   '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                   '<Relationship Id="rId1" '
+                   'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+                   'Target="word/document.xml"/></Relationships>')
+        z.writestr('word/document.xml', doc)
+
+
+def _pdf_str(line):
+    line = line.encode('latin-1', 'replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(text, fpath, lines_per_page=50):
+    """Write text as a minimal multi-page PDF using the built-in Helvetica font"""
+    lines = text.splitlines() or ['']
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    objs = ['<< /Type /Catalog /Pages 2 0 R >>', None,
+            '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    page_ids = []
+    for page in pages:
+        content = 'BT /F1 10 Tf 12 TL 50 780 Td ' + ' '.join(f'({_pdf_str(l)}) Tj T*' for l in page) + ' ET'
+        objs.append(f'<< /Length {len(content.encode("latin-1"))} >>\nstream\n{content}\nendstream')
+        objs.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+                    f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objs)} 0 R >>')
+        page_ids.append(len(objs))
+    objs[1] = f'<< /Type /Pages /Kids [{" ".join(f"{i} 0 R" for i in page_ids)}] /Count {len(page_ids)} >>'
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for num, obj in enumerate(objs, start=1):
+        offsets.append(len(out))
+        out += f'{num} 0 obj\n{obj}\nendobj\n'.encode('latin-1')
+    xref = len(out)
+    out += f'xref\n0 {len(objs) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    for off in offsets:
+        out += f'{off:010d} 00000 n \n'.encode('latin-1')
+    out += f'trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1')
+    with open(fpath, 'wb') as f:
+        f.write(out)
+
+
+def write_corpus(out_dir, n_resumes, n_jobs, n_files=0, seed=0):
+    """Write resumes.jsonl, jobs.json and n_files .docx/.pdf resumes under out_dir"""
+    os.makedirs(out_dir, exist_ok=True)
+    texts = generate_resumes(n_resumes, seed)
+    with open(os.path.join(out_dir, 'resumes.jsonl'), 'w', encoding='utf-8') as f:
+        for txt in texts:
+            f.write(json.dumps({'text': txt}) + '\n')
+    with open(os.path.join(out_dir, 'jobs.json'), 'w', encoding='utf-8') as f:
+        json.dump(generate_jobs(n_jobs, seed), f)
+    files_dir = os.path.join(out_dir, 'files')
+    os.makedirs(files_dir, exist_ok=True)
+    for i, txt in enumerate(texts[:n_files]):
+        write_docx(txt, os.path.join(files_dir, f'resume_{i}.docx'))
+        write_pdf(txt, os.path.join(files_dir, f'resume_{i}.pdf'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic resume/job corpus')
+    parser.add_argument('--resumes', type=int, default=1000)
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--files', type=int, default=0, help='also write this many .docx and .pdf resumes')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='corpus')
+    args = parser.parse_args()
+    write_corpus(args.out, args.resumes, args.jobs, args.files, args.seed)
+    print(f"Wrote {args.resumes} resumes, {args.jobs} jobs and {args.files} files per format to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,22 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { motion } from 'framer-motion';
 import axios from 'axios';
 
+// Download name from Content-Disposition: the RFC 5987 filename* form wins,
+// then filename= with or without quotes
+const downloadName = (disposition, fallback) => {
+  const star = disposition.match(/filename\*=UTF-8''([^;]+)/i);
+  if (star) {
+    try {
+      return decodeURIComponent(star[1].trim());
+    } catch (err) {
+      // Malformed escape; use the plain name instead
+    }
+  }
+  const plain = disposition.match(/filename="?([^";]+)"?/i);
+  return plain ? plain[1].trim() : fallback;
+};
+
 const Results = ({ data, onReset }) => {
   const [filteredJobs, setFilteredJobs] = useState(data.jobs);
   const [selLoc, setSelLoc] = useState('');
@@ -9,8 +24,23 @@ const Results = ({ data, onReset }) => {
   const [minMatch, setMinMatch] = useState(10);
   const [isFiltering, setIsFiltering] = useState(false);
   const [isRefreshing, setIsRefreshing] = useState(false);
+  const [facets, setFacets] = useState(null);
   const cacheInfo = data.cache_info || {};
   
+  // Filter options are precomputed server-side; the browser revalidates them by ETag
+  useEffect(() => {
+    axios.get('http://localhost:5000/api/facets')
+      .then(resp => setFacets(resp.data))
+      .catch(err => console.error('Facets error:', err));
+  }, []);
+  
+  const locOptions = facets
+    ? facets.locations
+    : (data.available_locations || []).map(loc => ({ value: loc }));
+  const skillOptions = facets
+    ? facets.skills.map(f => f.value)
+    : (data.available_skills || []);
+  
   const applyFilters = async () => {
     setIsFiltering(true);
     try {
@@ -57,16 +87,24 @@ const Results = ({ data, onReset }) => {
   
   const exportToExcel = async () => {
     try {
-      const resp = await axios.post('http://localhost:5000/api/export-excel', {
+      // The report is streamed back directly; nothing is left behind in uploads/
+      const resp = await axios.post('http://localhost:5000/api/export-report?format=xlsx', {
         filename: data.filename,
         email: data.email,
         phone: data.phone,
         skills: data.skills,
         jobs: filteredJobs
-      });
+      }, { responseType: 'blob' });
       
-      const msg = `Excel report saved successfully\n\nLocation: ${resp.data.relative_path}\n\nFilename: ${resp.data.filename}`;
-      alert(msg);
+      const disposition = resp.headers['content-disposition'] || '';
+      const url = window.URL.createObjectURL(resp.data);
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = downloadName(disposition, 'job_matches.xlsx');
+      document.body.appendChild(link);
+      link.click();
+      link.remove();
+      window.URL.revokeObjectURL(url);
     } catch (err) {
       console.error('Export error:', err);
       alert('Failed to export to Excel. Please try again.');
@@ -137,8 +175,10 @@ const Results = ({ data, onReset }) => {
                 className="filterSelect"
               >
                 <option value="">All Locations</option>
-                {data.available_locations && data.available_locations.map((loc, idx) => (
-                  <option key={idx} value={loc}>{loc}</option>
+                {locOptions.map((loc, idx) => (
+                  <option key={idx} value={loc.value}>
+                    {loc.count ? `${loc.value} (${loc.count})` : loc.value}
+                  </option>
                 ))}
               </select>
             </div>
@@ -160,7 +200,7 @@ const Results = ({ data, onReset }) => {
           <div className="filterGroup">
             <label>Required Skills:</label>
             <div className="skillsMultiselect">
-              {data.available_skills && data.available_skills.slice(0, 20).map((skill, idx) => (
+              {skillOptions.slice(0, 20).map((skill, idx) => (
                 <button
                   key={idx}
                   className={`skillFilterBtn ${selSkills.includes(skill) ? 'active' : ''}`}